@@ -5,11 +5,19 @@ setup(
     version="0.1",
     packages=find_packages(),
     install_requires=[
-        "httpx>=0.25.2",
+        "httpx[http2]>=0.25.2",
+        "orjson>=3.8.0",
         "pydantic>=2.5.2",
         "pydantic-settings>=2.0.3",
         "pytest>=7.4.3",
         "pytest-asyncio>=0.21.1",
         "python-dotenv>=1.0.0"
-    ]
+    ],
+    extras_require={
+        "hyperscan": ["hyperscan>=0.4.0"],
+        "numba": ["numpy>=1.24", "numba>=0.58"],
+        "pandas": ["pandas>=2.0"],
+        "uvloop": ["uvloop>=0.18.0; sys_platform != 'win32'"],
+        "test": ["pytest-xdist>=3.5.0", "respx>=0.20.2"]
+    }
 )
@@ -0,0 +1,114 @@
+"""On-disk cache for SEMrush API responses."""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, Any
+import orjson
+from src.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+class FileCache:
+    """Gzip-compressed JSON file cache with a time-to-live."""
+
+    def __init__(self, dir: str = '.cache/semrush', ttl_seconds: int = 86400):
+        """
+        Initialize file cache.
+        
+        Args:
+            dir: Directory the cache files are stored in
+            ttl_seconds: Seconds an entry stays valid; 0 disables the cache
+        """
+        self.dir = Path(dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        domain: str,
+        database: str,
+        display_date: str,
+        account: str
+    ) -> str:
+        """
+        Build the cache key for an API request.
+        
+        Args:
+            endpoint: API endpoint name
+            domain: Domain the request is for
+            database: SEMrush regional database
+            display_date: Date the report is for
+            account: API key the request is made with, so accounts never
+                share entries
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        return hashlib.md5(
+            f"{endpoint}|{domain}|{database}|{display_date}|{account}".encode()
+        ).hexdigest()
+
+    def _path(self, endpoint: str, key: str) -> Path:
+        """Get the file path for a cache entry."""
+        return self.dir / endpoint / f"{key}.json.gz"
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+        
+        Args:
+            endpoint: API endpoint name
+            key: Cache key from make_key()
+        
+        Returns:
+            Cached response data, or None if missing or expired
+        """
+        if self.ttl_seconds <= 0:
+            return None
+
+        path = self._path(endpoint, key)
+        try:
+            with gzip.open(path, 'rb') as f:
+                entry = orjson.loads(f.read())
+            # Valid JSON that is not an entry written by set() is a miss too
+            expired = time.time() - entry['_ts'] >= self.ttl_seconds
+            data = entry['data']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+            return None
+
+        return None if expired else data
+
+    def set(self, endpoint: str, key: str, data: Any) -> None:
+        """
+        Store a response in the cache.
+        
+        Args:
+            endpoint: API endpoint name
+            key: Cache key from make_key()
+            data: Response data to store
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        path = self._path(endpoint, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename so readers never see a
+            # partially written entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                    f.write(orjson.dumps({'_ts': time.time(), 'data': data}))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Failed to write cache file %s: %s", path, e)
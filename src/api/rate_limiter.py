@@ -1,23 +1,22 @@
 """Rate limiting implementation for API requests."""
 
 import time
-from typing import Optional, Dict
-import threading
+import asyncio
+from typing import Awaitable, Callable, Optional, Dict
+import _thread
 from datetime import datetime
-import queue
 import logging
 from src.config.logging import get_logger
 
 logger = get_logger(__name__)
 
 class RateLimiter:
-    """Thread-safe rate limiter for API requests."""
+    """Thread-safe token-bucket rate limiter for API requests."""
     
     def __init__(
         self,
         calls_per_second: int = 10,
-        calls_per_minute: int = 600,
-        max_retries: int = 3
+        calls_per_minute: int = 600
     ):
         """
         Initialize rate limiter.
@@ -25,91 +24,101 @@ class RateLimiter:
         Args:
             calls_per_second: Maximum calls allowed per second (adjusted to SEMrush API V3 limits)
             calls_per_minute: Maximum calls allowed per minute (adjusted to SEMrush API V3 limits)
-            max_retries: Maximum number of retries when rate limit is hit
         """
         self.calls_per_second = calls_per_second
         self.calls_per_minute = calls_per_minute
-        self.max_retries = max_retries
         
-        # Tracking queues for different time windows
-        self.second_queue = queue.Queue()
-        self.minute_queue = queue.Queue()
+        # Token buckets for the two time windows, starting full
+        self._second_tokens = float(calls_per_second)
+        self._minute_tokens = float(calls_per_minute)
+        self._minute_rate = calls_per_minute / 60.0
+        self._last_refill = time.monotonic()
         
         # Thread lock for synchronization
-        self._lock = threading.Lock()
+        self._lock = _thread.allocate_lock()
 
-    def _clean_queue(self, q: queue.Queue, interval: float) -> int:
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill, capped at bucket capacity."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._second_tokens = min(
+            self.calls_per_second,
+            self._second_tokens + elapsed * self.calls_per_second
+        )
+        self._minute_tokens = min(
+            self.calls_per_minute,
+            self._minute_tokens + elapsed * self._minute_rate
+        )
+
+    def _reserve(self) -> float:
         """
-        Clean expired timestamps from a queue.
+        Reserve a token from both buckets.
+        
+        The token is taken immediately, so the buckets may go negative; later
+        callers then wait for the tokens already promised to earlier ones.
         
-        Args:
-            q: Queue to clean
-            interval: Time interval in seconds
-            
         Returns:
-            Number of valid items remaining in queue
+            Seconds to wait before the reserved request may be sent
         """
-        current_time = time.time()
-        valid_times = []
-        
-        # Empty the queue and keep valid timestamps
-        while not q.empty():
-            timestamp = q.get()
-            if current_time - timestamp <= interval:
-                valid_times.append(timestamp)
-        
-        # Put back valid timestamps
-        for timestamp in valid_times:
-            q.put(timestamp)
-            
-        return len(valid_times)
+        with self._lock:
+            self._refill()
+            sleep_time = max(
+                0.0,
+                (1 - self._second_tokens) / self.calls_per_second,
+                (1 - self._minute_tokens) / self._minute_rate
+            )
+            self._second_tokens -= 1
+            self._minute_tokens -= 1
+            return sleep_time
 
-    def _wait_if_needed(self, current_count: int, limit: int, interval: float) -> None:
+    def try_acquire(self) -> bool:
         """
-        Wait if current count exceeds limit.
+        Take a token without waiting.
         
-        Args:
-            current_count: Current number of requests
-            limit: Maximum allowed requests
-            interval: Time interval in seconds
+        Returns:
+            True if a token was available and consumed, False otherwise
         """
-        if current_count >= limit:
-            sleep_time = max(0, interval - (time.time() - self.second_queue.queue[0]))
-            if sleep_time > 0:
-                logger.debug(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
+        with self._lock:
+            self._refill()
+            if self._second_tokens >= 1 and self._minute_tokens >= 1:
+                self._second_tokens -= 1
+                self._minute_tokens -= 1
+                return True
+            return False
 
     def wait(self) -> None:
+        """Wait if necessary to comply with rate limits."""
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.debug("Rate limit reached. Sleeping for %.2f seconds", sleep_time)
+            time.sleep(sleep_time)
+
+class AsyncRateLimiter:
+    """Asyncio-native view of a RateLimiter that sleeps on the event loop."""
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
         """
-        Wait if necessary to comply with rate limits.
+        Initialize asyncio rate limiter.
         
-        Raises:
-            RuntimeError: If rate limit cannot be satisfied after max retries
+        Args:
+            limiter: Rate limiter whose token buckets are shared, so sync and
+                asyncio callers draw from one budget
+            sleep: Coroutine function used to wait for a reserved slot
         """
-        with self._lock:
-            retries = 0
-            while retries < self.max_retries:
-                # Clean and check second-based queue
-                second_count = self._clean_queue(self.second_queue, 1.0)
-                if second_count >= self.calls_per_second:
-                    self._wait_if_needed(second_count, self.calls_per_second, 1.0)
-                
-                # Clean and check minute-based queue
-                minute_count = self._clean_queue(self.minute_queue, 60.0)
-                if minute_count >= self.calls_per_minute:
-                    self._wait_if_needed(minute_count, self.calls_per_minute, 60.0)
-                
-                # If both checks pass, record the request
-                current_time = time.time()
-                if second_count < self.calls_per_second and minute_count < self.calls_per_minute:
-                    self.second_queue.put(current_time)
-                    self.minute_queue.put(current_time)
-                    return
-                
-                retries += 1
-                time.sleep(1)  # Wait before retry
-            
-            raise RuntimeError("Failed to satisfy rate limit after maximum retries")
+        self.limiter = limiter
+        self._sleep = sleep
+
+    async def wait(self) -> None:
+        """Wait if necessary to comply with rate limits, yielding to the event loop."""
+        sleep_time = self.limiter._reserve()
+        if sleep_time > 0:
+            logger.debug("Rate limit reached. Sleeping for %.2f seconds", sleep_time)
+            await self._sleep(sleep_time)
 
 class RateLimitManager:
     """Manages multiple rate limiters for different API endpoints."""
@@ -117,7 +126,8 @@ class RateLimitManager:
     def __init__(self):
         """Initialize rate limit manager."""
         self._limiters: Dict[str, RateLimiter] = {}
-        self._lock = threading.Lock()
+        self._async_limiters: Dict[str, AsyncRateLimiter] = {}
+        self._lock = _thread.allocate_lock()
 
     def get_limiter(
         self,
@@ -136,13 +146,53 @@ class RateLimitManager:
         Returns:
             RateLimiter instance for the endpoint
         """
+        # Fast path: dict reads are atomic, so only lock to create a limiter
+        limiter = self._limiters.get(endpoint)
+        if limiter is not None:
+            return limiter
+        
         with self._lock:
-            if endpoint not in self._limiters:
-                self._limiters[endpoint] = RateLimiter(
+            limiter = self._limiters.get(endpoint)
+            if limiter is None:
+                limiter = RateLimiter(
                     calls_per_second=calls_per_second or 10,
                     calls_per_minute=calls_per_minute or 600
                 )
-            return self._limiters[endpoint]
+                self._limiters[endpoint] = limiter
+            return limiter
+
+    def get_async_limiter(
+        self,
+        endpoint: str,
+        calls_per_second: Optional[int] = None,
+        calls_per_minute: Optional[int] = None
+    ) -> AsyncRateLimiter:
+        """
+        Get or create an asyncio rate limiter for an endpoint.
+        
+        The asyncio limiter shares the token buckets of get_limiter(endpoint),
+        so the endpoint has one budget whichever API the caller uses.
+        
+        Args:
+            endpoint: API endpoint identifier
+            calls_per_second: Optional override for calls per second
+            calls_per_minute: Optional override for calls per minute
+            
+        Returns:
+            AsyncRateLimiter instance for the endpoint
+        """
+        limiter = self._async_limiters.get(endpoint)
+        if limiter is not None:
+            return limiter
+        
+        # Resolved before taking the lock, which is not reentrant
+        sync_limiter = self.get_limiter(endpoint, calls_per_second, calls_per_minute)
+        with self._lock:
+            limiter = self._async_limiters.get(endpoint)
+            if limiter is None:
+                limiter = AsyncRateLimiter(sync_limiter)
+                self._async_limiters[endpoint] = limiter
+            return limiter
 
     def wait_for_endpoint(self, endpoint: str) -> None:
         """
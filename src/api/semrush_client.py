@@ -1,35 +1,121 @@
 """SEMrush API V3 client implementation for domain metrics."""
 
-import os
-from typing import Optional, Dict, Any, List, Union
+import asyncio
+import atexit
+import logging
+import threading
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List
 import httpx
-from urllib.parse import urljoin
-from datetime import datetime
+import orjson
+from urllib.parse import urlencode, quote
 
-from .rate_limiter import rate_limit_manager
-from src.exceptions.errors import APIError
+try:
+    import uvloop
+except ImportError:  # optional extra; not available on Windows
+    uvloop = None
+
+from .cache import FileCache
+from .rate_limiter import RateLimiter, AsyncRateLimiter, rate_limit_manager
+from src.exceptions.errors import APIError, DomainValidationError
 from src.config.logging import get_logger
-from src.config.settings import settings
+from src.config.settings import SETTINGS
+from src.utils.validation import validation_helper
 
 logger = get_logger(__name__)
 
+def _run(coro):
+    """Run a coroutine on a new event loop, using uvloop when installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+# Headers sent with every request
+_DEFAULT_HEADERS = {
+    'User-Agent': 'semrush-domain-metrics/0.1',
+    'Accept-Encoding': 'gzip'
+}
+
+# Connection pool shared by every client in the process so keep-alive
+# connections and TLS sessions survive across client instances
+_shared_client: Optional[httpx.Client] = None
+_shared_client_lock = threading.Lock()
+
+def _get_shared_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+    
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _shared_client
+    client = _shared_client
+    if client is not None and not client.is_closed:
+        return client
+    
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=60.0
+                ),
+                headers=_DEFAULT_HEADERS
+            )
+        return _shared_client
+
+def shutdown() -> None:
+    """Close the shared HTTP connection pool."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+# Close pooled connections at interpreter exit instead of leaving it to
+# garbage collection
+atexit.register(shutdown)
+
 class SEMrushAPIV3Client:
-    """Client for interacting with SEMrush Analytics API V3."""
+    """
+    Client for interacting with SEMrush Analytics API V3.
+    
+    Example:
+        >>> with SEMrushAPIV3Client() as client:
+        ...     client.get_domain_overview('example.com')
+    """
+    
+    # Domain metrics specific export columns per endpoint
+    ENDPOINT_COLUMNS = {
+        'domain_overview': 'Dn,Rk,Or,Ot,Oc',
+        'domain_metrics': 'Ph,Po,Nq,Cp,Ur,Tr',
+        'backlinks_overview': 'total,domains_num,urls_num,ips_num,ipclassc_num,follows_num,nofollows_num'
+    }
     
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: str = 'https://api.semrush.com/analytics/v3',  # Fixed base URL
-        database: str = 'us'
+        database: str = 'us',
+        cache: Optional[FileCache] = None
     ):
         """Initialize SEMrush API V3 client."""
-        self.api_key = api_key or settings.SEMRUSH_API_KEY
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
+        self.api_key = api_key or SETTINGS.SEMRUSH_API_KEY
         if not self.api_key:
             raise APIError("SEMRUSH_API_KEY not provided or found in environment")
             
         self.base_url = base_url
         self.database = database
-        self.client = httpx.Client(timeout=30.0)
+        # Responses are only cached when a cache is passed in, e.g.
+        # FileCache(SETTINGS.CACHE_DIR, SETTINGS.CACHE_TTL_SECONDS); a cache
+        # with a TTL of zero is dropped so requests skip it entirely
+        self.cache = cache if cache is not None and cache.ttl_seconds > 0 else None
         
         # Domain metrics specific endpoint rate limits
         self.endpoint_limits = {
@@ -37,6 +123,48 @@ class SEMrushAPIV3Client:
             'domain_metrics': {'per_second': 1, 'per_minute': 45},
             'backlinks_overview': {'per_second': 1, 'per_minute': 45}
         }
+        
+        # Per-endpoint request state resolved once at construction: the URL
+        # with the invariant query string already encoded (only the domain is
+        # appended per call) and the endpoint's sync and asyncio rate limiters
+        endpoints = {}
+        for endpoint, columns in self.ENDPOINT_COLUMNS.items():
+            limits = self.endpoint_limits[endpoint]
+            endpoints[endpoint] = (
+                f"{self.base_url}/{endpoint}?{urlencode(self._prepare_params(columns))}",
+                rate_limit_manager.get_limiter(
+                    endpoint,
+                    calls_per_second=limits['per_second'],
+                    calls_per_minute=limits['per_minute']
+                ),
+                rate_limit_manager.get_async_limiter(
+                    endpoint,
+                    calls_per_second=limits['per_second'],
+                    calls_per_minute=limits['per_minute']
+                )
+            )
+        self._endpoints = MappingProxyType(endpoints)
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared synchronous client, reopened if the pool was shut down."""
+        return _get_shared_client()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Asynchronous client session, opened on first use."""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0
+                ),
+                headers=_DEFAULT_HEADERS
+            )
+        return self._async_client
 
     def get_domain_overview(self, domain: str) -> Dict[str, Any]:
         """
@@ -48,10 +176,7 @@ class SEMrushAPIV3Client:
         Returns:
             Domain overview data
         """
-        endpoint = '/domain_overview'
-        columns = 'Dn,Rk,Or,Ot,Oc'  # Domain metrics specific columns
-        params = self._prepare_params(domain, columns)
-        return self._make_request(endpoint, params)
+        return self._get('domain_overview', domain)
 
     def get_domain_metrics(self, domain: str) -> Dict[str, Any]:
         """
@@ -63,10 +188,7 @@ class SEMrushAPIV3Client:
         Returns:
             Domain metrics data
         """
-        endpoint = '/domain_metrics'
-        columns = 'Ph,Po,Nq,Cp,Ur,Tr'  # Domain metrics specific columns
-        params = self._prepare_params(domain, columns)
-        return self._make_request(endpoint, params)
+        return self._get('domain_metrics', domain)
 
     def get_backlinks_overview(self, domain: str) -> Dict[str, Any]:
         """
@@ -78,25 +200,220 @@ class SEMrushAPIV3Client:
         Returns:
             Backlinks overview data
         """
-        endpoint = '/backlinks_overview'
-        columns = 'total,domains_num,urls_num,ips_num,ipclassc_num,follows_num,nofollows_num'
-        params = self._prepare_params(domain, columns)
-        return self._make_request(endpoint, params)
+        return self._get('backlinks_overview', domain)
+
+    async def aget_domain_overview(self, domain: str) -> Dict[str, Any]:
+        """
+        Get domain overview analytics without blocking the event loop.
+        
+        Args:
+            domain: Domain to analyze
+            
+        Returns:
+            Domain overview data
+        """
+        return await self._aget('domain_overview', domain)
+
+    async def aget_domain_metrics(self, domain: str) -> Dict[str, Any]:
+        """
+        Get detailed domain metrics without blocking the event loop.
+        
+        Args:
+            domain: Domain to analyze
+            
+        Returns:
+            Domain metrics data
+        """
+        return await self._aget('domain_metrics', domain)
+
+    async def aget_backlinks_overview(self, domain: str) -> Dict[str, Any]:
+        """
+        Get backlinks overview data without blocking the event loop.
+        
+        Args:
+            domain: Domain to analyze
+            
+        Returns:
+            Backlinks overview data
+        """
+        return await self._aget('backlinks_overview', domain)
+
+    async def aget_all(self, domain: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get overview, metrics and backlinks data for a domain concurrently.
+        
+        Args:
+            domain: Domain to analyze
+            
+        Returns:
+            Dictionary with 'overview', 'metrics' and 'backlinks' data
+        """
+        overview, metrics, backlinks = await asyncio.gather(
+            self.aget_domain_overview(domain),
+            self.aget_domain_metrics(domain),
+            self.aget_backlinks_overview(domain)
+        )
+        return {'overview': overview, 'metrics': metrics, 'backlinks': backlinks}
+
+    async def abatch(self, domains: List[str]) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Get all domain data for several domains concurrently.
+        
+        Requests are multiplexed over the HTTP/2 connection and throttled
+        only by the per-endpoint rate limiters.
+        
+        Args:
+            domains: Domains to analyze
+            
+        Returns:
+            List of aget_all() results in the same order as domains
+        """
+        return await asyncio.gather(*(self.aget_all(domain) for domain in domains))
+
+    def batch(self, domains: List[str]) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Get all domain data for several domains from synchronous code.
+        
+        Runs abatch() on a fresh event loop (uvloop when available) and
+        closes the asynchronous session before returning.
+        
+        Args:
+            domains: Domains to analyze
+            
+        Returns:
+            List of aget_all() results in the same order as domains
+        """
+        async def run_batch():
+            try:
+                return await self.abatch(domains)
+            finally:
+                await self.aclose()
+        
+        return _run(run_batch())
+
+    def _get(self, endpoint: str, domain: str) -> Dict[str, Any]:
+        """
+        Get endpoint data for a domain, serving it from the cache when one is set and fresh.
+        
+        Args:
+            endpoint: Endpoint name
+            domain: Domain to analyze
+            
+        Returns:
+            API response data
+            
+        Raises:
+            DomainValidationError: If the domain is invalid (an APIError)
+            APIError: If the request fails
+        """
+        self._check_domain(domain)
+        url_prefix, rate_limiter, _ = self._endpoints[endpoint]
+        if self.cache is None:
+            return self._make_request(self._domain_url(url_prefix, domain), rate_limiter)
+        
+        key = self._cache_key(endpoint, domain)
+        data = self.cache.get(endpoint, key)
+        if data is None:
+            data = self._make_request(self._domain_url(url_prefix, domain), rate_limiter)
+            self.cache.set(endpoint, key, data)
+        return data
+
+    async def _aget(self, endpoint: str, domain: str) -> Dict[str, Any]:
+        """
+        Get endpoint data for a domain asynchronously, serving it from the cache when one is set and fresh.
+        
+        Args:
+            endpoint: Endpoint name
+            domain: Domain to analyze
+            
+        Returns:
+            API response data
+            
+        Raises:
+            DomainValidationError: If the domain is invalid (an APIError)
+            APIError: If the request fails
+        """
+        self._check_domain(domain)
+        url_prefix, _, rate_limiter = self._endpoints[endpoint]
+        if self.cache is None:
+            return await self._amake_request(self._domain_url(url_prefix, domain), rate_limiter)
+        
+        key = self._cache_key(endpoint, domain)
+        # Cache file I/O runs in a worker thread so it never blocks the loop
+        data = await asyncio.to_thread(self.cache.get, endpoint, key)
+        if data is None:
+            data = await self._amake_request(self._domain_url(url_prefix, domain), rate_limiter)
+            await asyncio.to_thread(self.cache.set, endpoint, key, data)
+        return data
 
-    def _prepare_params(self, domain: str, columns: str = None) -> Dict[str, Any]:
+    @staticmethod
+    def _check_domain(domain: str) -> None:
         """
-        Prepare common parameters for API requests.
+        Reject a malformed domain before any cache or network access.
+        
+        A fully qualified name's trailing dot is ignored and internationalized
+        names are checked in their IDNA (punycode) form.
         
         Args:
             domain: Domain to analyze
+            
+        Raises:
+            DomainValidationError: If the domain is not a valid domain name;
+                both an APIError and a ValidationError, so callers catching
+                either see it, and retry loops re-raise it at once
+        """
+        name = domain[:-1] if domain.endswith('.') else domain
+        if not name.isascii():
+            try:
+                name = name.encode('idna').decode('ascii')
+            except UnicodeError:
+                name = ''
+        if not validation_helper.validate_domain(name):
+            raise DomainValidationError(f"Invalid domain: {domain!r}")
+
+    def _cache_key(self, endpoint: str, domain: str) -> str:
+        """
+        Build the cache key for a domain request.
+        
+        'yesterday' is resolved to a calendar date so an entry is never
+        served for a later day's report.
+        
+        Args:
+            endpoint: Endpoint name
+            domain: Domain to analyze
+            
+        Returns:
+            Cache key
+        """
+        display_date = (date.today() - timedelta(days=1)).isoformat()
+        return FileCache.make_key(endpoint, domain, self.database, display_date, self.api_key)
+
+    @staticmethod
+    def _domain_url(url_prefix: str, domain: str) -> str:
+        """
+        Build the request URL for a domain request.
+        
+        Args:
+            url_prefix: Endpoint URL including the invariant query string
+            domain: Domain to analyze
+            
+        Returns:
+            Request URL including the encoded query string
+        """
+        return f"{url_prefix}&domain={quote(domain, safe='')}"
+
+    def _prepare_params(self, columns: str = None) -> Dict[str, Any]:
+        """
+        Prepare the parameters shared by every request to an endpoint.
+        
+        Args:
             columns: Comma-separated list of columns to export
             
         Returns:
-            Dictionary of request parameters
+            Dictionary of request parameters, without the domain
         """
         params = {
             'key': self.api_key,
-            'domain': domain,  # Changed from 'target' to 'domain'
             'database': self.database,
             'display_date': 'yesterday',  # Required parameter
             'display_limit': 100
@@ -109,16 +426,16 @@ class SEMrushAPIV3Client:
 
     def _make_request(
         self,
-        endpoint: str,
-        params: Dict[str, Any],
+        url: str,
+        rate_limiter: RateLimiter,
         method: str = 'GET'
     ) -> Dict[str, Any]:
         """
         Make API request with rate limiting.
         
         Args:
-            endpoint: API endpoint
-            params: Request parameters
+            url: Request URL including the query string
+            rate_limiter: Rate limiter for the endpoint
             method: HTTP method
             
         Returns:
@@ -127,52 +444,155 @@ class SEMrushAPIV3Client:
         Raises:
             APIError: If the request fails
         """
-        endpoint_key = endpoint.lstrip('/').split('/')[0]  # Get base endpoint name
-        rate_limiter = self._get_rate_limiter(endpoint_key)
         rate_limiter.wait()
         
-        url = f"{self.base_url}{endpoint}"
-        
         try:
-            response = self.client.request(method, url, params=params)
-            
-            # Log full request details in debug mode
-            logger.debug(f"Request URL: {response.url}")
-            logger.debug(f"Request params: {params}")
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response text: {response.text}")
+            response = self.client.request(method, url)
+            return self._parse_response(response)
+        except httpx.HTTPStatusError as e:
+            raise self._status_error(e)
+        except httpx.TimeoutException as e:
+            logger.warning("API request timed out: %s", e)
+            raise APIError(f"Request timed out: {str(e)}")
+        except httpx.RequestError as e:
+            logger.warning("API request error: %s", e)
+            raise APIError(f"Request failed: {str(e)}")
+        except Exception as e:
+            logger.exception("Unexpected error during API request")
+            raise APIError(f"Request failed: {str(e)}")
+
+    async def _amake_request(
+        self,
+        url: str,
+        rate_limiter: AsyncRateLimiter,
+        method: str = 'GET'
+    ) -> Dict[str, Any]:
+        """
+        Make asynchronous API request with rate limiting.
+        
+        Args:
+            url: Request URL including the query string
+            rate_limiter: Asyncio rate limiter for the endpoint
+            method: HTTP method
             
-            response.raise_for_status()
-            return response.json()
+        Returns:
+            API response data
             
+        Raises:
+            APIError: If the request fails
+        """
+        await rate_limiter.wait()
+        
+        try:
+            response = await self.async_client.request(method, url)
+            return self._parse_response(response)
         except httpx.HTTPStatusError as e:
-            error_text = str(e)
-            try:
-                error_json = e.response.json()
-                if isinstance(error_json, dict):
-                    error_text = error_json.get('error', {}).get('message', str(e))
-            except Exception:
-                pass
-            
-            logger.error(f"API request failed with status code {e.response.status_code}: {error_text}")
-            raise APIError(
-                f"API request failed: {error_text}",
-                status_code=e.response.status_code,
-                response_text=e.response.text
-            )
+            raise self._status_error(e)
+        except httpx.TimeoutException as e:
+            logger.warning("API request timed out: %s", e)
+            raise APIError(f"Request timed out: {str(e)}")
+        except httpx.RequestError as e:
+            logger.warning("API request error: %s", e)
+            raise APIError(f"Request failed: {str(e)}")
         except Exception as e:
             logger.exception("Unexpected error during API request")
             raise APIError(f"Request failed: {str(e)}")
 
-    def _get_rate_limiter(self, endpoint: str):
-        """Get rate limiter for specific endpoint."""
-        limits = self.endpoint_limits.get(endpoint, {})
-        return rate_limit_manager.get_limiter(
-            endpoint,
-            calls_per_second=limits.get('per_second', 1),
-            calls_per_minute=limits.get('per_minute', 45)
+    def _parse_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Log and decode an API response.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            API response data
+            
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status
+        """
+        # Log request details in debug mode; only the head of the raw body is
+        # logged so the response is never decoded to text
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request URL: %s", response.url)
+            logger.debug(
+                "Response status=%s len=%d head=%r",
+                response.status_code,
+                len(response.content),
+                response.content[:256]
+            )
+        
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _status_error(self, e: httpx.HTTPStatusError) -> APIError:
+        """
+        Build an APIError from an HTTP error status.
+        
+        Args:
+            e: HTTP status error raised by httpx
+            
+        Returns:
+            APIError describing the failure
+        """
+        error_text = str(e)
+        try:
+            error_json = orjson.loads(e.response.content)
+            if isinstance(error_json, dict):
+                error_text = error_json.get('error', {}).get('message', str(e))
+        except Exception:
+            pass
+        
+        logger.error(
+            "API request failed with status code %s: %s",
+            e.response.status_code,
+            error_text
         )
+        return APIError(
+            f"API request failed: {error_text}",
+            status_code=e.response.status_code,
+            response_text=e.response.text
+        )
+
+    def close(self) -> None:
+        """
+        Close the asynchronous client session, if one is open.
+        
+        The synchronous connection pool is shared by all clients in the
+        process and is left open for reuse; call shutdown() to close it. The
+        client stays usable after close(), later requests reopen what they
+        need. Inside a running event loop the asynchronous session cannot be
+        closed here, so a warning is logged; await aclose() instead.
+        """
+        if self._async_client is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                _run(self.aclose())
+            except RuntimeError as e:
+                # Connections opened on an event loop that has since closed
+                # cannot be shut down cleanly; drop the session instead
+                logger.debug("Dropping asynchronous session: %s", e)
+                self._async_client = None
+        else:
+            logger.warning("close() called inside an event loop; await aclose() to close the asynchronous session")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the asynchronous client session."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def __aenter__(self):
+        return self
 
-    def __del__(self):
-        """Cleanup client session."""
-        self.client.close()
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -1,6 +1,7 @@
 """Application settings and configuration."""
 
 import os
+from types import SimpleNamespace
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import PostgresDsn
@@ -22,6 +23,10 @@ class Settings(BaseSettings):
     MAX_RETRIES: int = 3
     RETRY_DELAY: int = 5
     
+    # Cache Settings
+    CACHE_DIR: str = ".cache/semrush"
+    CACHE_TTL_SECONDS: int = 86400
+    
     # Logging Settings
     LOG_LEVEL: str = "INFO"
     LOG_FILE: Optional[str] = None
@@ -33,3 +38,10 @@ class Settings(BaseSettings):
 
 # Create global settings instance
 settings = Settings()
+
+# Plain snapshot of the validated settings for hot paths; attribute reads
+# skip pydantic and DATABASE_URL is already a string
+SETTINGS = SimpleNamespace(**{
+    **settings.model_dump(),
+    'DATABASE_URL': str(settings.DATABASE_URL)
+})
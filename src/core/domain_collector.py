@@ -1,11 +1,16 @@
 """Domain metrics collector implementation."""
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
+import psycopg2
+from psycopg2.extras import execute_values
 
 from src.collectors.base import BaseCollector
+from src.config.settings import SETTINGS
+from src.db.connection import execute_prepared
 from src.utils.validation import validation_helper
-from src.exceptions.errors import APIError, DatabaseError
+from src.exceptions.errors import APIError, DatabaseError, QueryError, ValidationError
 
 class DomainMetricsCollector(BaseCollector):
     """Collects and stores domain-level metrics from SEMrush."""
@@ -14,6 +19,9 @@ class DomainMetricsCollector(BaseCollector):
         """Initialize domain metrics collector."""
         super().__init__(*args, **kwargs)
         
+        # Domain ID, resolved on first use; self.domain never changes
+        self._domain_id: Optional[int] = None
+        
         # Required columns for domain metrics table
         self.required_columns = [
             'date',
@@ -61,6 +69,10 @@ class DomainMetricsCollector(BaseCollector):
         """
         Collect domain metrics data.
         
+        Called from inside a running event loop, where asyncio.run() is not
+        allowed, the domain ID and the metrics are fetched one after another
+        with the synchronous client instead of concurrently.
+        
         Returns:
             True if collection successful, False otherwise
         """
@@ -69,35 +81,30 @@ class DomainMetricsCollector(BaseCollector):
             if not self.validate_table_schema('semrush_domain_metrics', self.required_columns):
                 return False
             
-            # Get domain ID
-            domain_id = self._get_or_create_domain_id()
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Resolve the domain ID while organic/paid and backlink
+                # metrics are fetched
+                domain_id, metrics, backlink_data = asyncio.run(self._fetch_api_metrics())
+            else:
+                domain_id, metrics, backlink_data = self._fetch_metrics_sequentially()
             if not domain_id:
                 return False
             
             # Collect metrics
             all_metrics = {}
             
-            # Get organic/paid metrics
-            try:
-                metrics = self._retry_operation(
-                    self.api_client.get_domain_metrics,
-                    self.domain
-                )
-                all_metrics.update(metrics)
-            except APIError as e:
-                self.logger.error(f"Failed to get domain metrics: {str(e)}")
+            if isinstance(metrics, Exception):
+                self.logger.error(f"Failed to get domain metrics: {str(metrics)}")
                 return False
+            all_metrics.update(metrics)
             
-            # Get backlink metrics
-            try:
-                backlink_data = self._retry_operation(
-                    self.api_client.get_backlinks,
-                    self.domain
-                )
-                all_metrics.update(backlink_data)
-            except APIError as e:
-                self.logger.warning(f"Failed to get backlink metrics: {str(e)}")
+            if isinstance(backlink_data, Exception):
+                self.logger.warning(f"Failed to get backlink metrics: {str(backlink_data)}")
                 # Continue without backlink data
+            else:
+                all_metrics.update(backlink_data)
             
             # Add metadata
             all_metrics.update({
@@ -118,6 +125,140 @@ class DomainMetricsCollector(BaseCollector):
             self.logger.error(f"Failed to collect domain metrics: {str(e)}")
             return False
 
+    def _process_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        table: str,
+        validator
+    ) -> int:
+        """
+        Validate and upsert a batch of metrics rows.
+        
+        All valid rows are sent in multi-row INSERT statements, so a batch
+        costs one round-trip per page instead of one per row. A row for a
+        (domain_id, date) that already exists is updated in place.
+        
+        Args:
+            batch: Metrics rows to store
+            table: Target table name
+            validator: Callable returning the validation errors for a row
+            
+        Returns:
+            Number of rows stored
+        """
+        values = []
+        for row in batch:
+            errors = validator(row)
+            if errors:
+                self.logger.warning(f"Skipping invalid row for {row.get('date')}: {errors}")
+                continue
+            values.append(tuple(row.get(column) for column in self.required_columns))
+        
+        if not values:
+            return 0
+        
+        updates = ', '.join(
+            f"{column} = EXCLUDED.{column}"
+            for column in self.required_columns
+            if column not in ('domain_id', 'date')
+        )
+        query = f"""
+            INSERT INTO {table} ({', '.join(self.required_columns)}) VALUES %s
+            ON CONFLICT (domain_id, date) DO UPDATE SET {updates}
+        """
+        
+        try:
+            with self.db.connection() as conn:
+                with conn.cursor() as cur:
+                    execute_values(cur, query, values, page_size=500)
+            return len(values)
+        except psycopg2.Error as e:
+            self.logger.error(f"Failed to store {table} rows: {str(e)}")
+            return 0
+
+    async def _fetch_api_metrics(self) -> List[Any]:
+        """
+        Fetch domain and backlink metrics concurrently with the domain ID lookup.
+        
+        The blocking database upsert runs in a worker thread so its round-trip
+        overlaps the API requests. If the domain ID cannot be resolved the
+        requests are cancelled, so no quota is spent on results that would be
+        discarded.
+        
+        Returns:
+            Domain ID, domain metrics and backlink data, with the raised
+            exception in place of either API result if that request failed
+            after retries; three Nones if the domain ID could not be resolved
+        """
+        tasks = [
+            asyncio.create_task(self._aretry_operation(self.api_client.aget_domain_metrics, self.domain)),
+            asyncio.create_task(self._aretry_operation(self.api_client.aget_backlinks_overview, self.domain))
+        ]
+        try:
+            domain_id = await asyncio.to_thread(self._get_or_create_domain_id)
+            if not domain_id:
+                for task in tasks:
+                    task.cancel()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # The async session is bound to this event loop
+            await self.api_client.aclose()
+        
+        if not domain_id:
+            return [None, None, None]
+        return [domain_id, *results]
+
+    def _fetch_metrics_sequentially(self) -> List[Any]:
+        """
+        Fetch the domain ID, then domain and backlink metrics, one at a time.
+        
+        Used by collect() when an event loop is already running in this
+        thread.
+        
+        Returns:
+            Same as _fetch_api_metrics()
+        """
+        domain_id = self._get_or_create_domain_id()
+        if not domain_id:
+            return [None, None, None]
+        
+        results = [domain_id]
+        for operation in (self.api_client.get_domain_metrics, self.api_client.get_backlinks_overview):
+            try:
+                results.append(self._retry_operation(operation, self.domain))
+            except APIError as e:
+                results.append(e)
+        return results
+
+    async def _aretry_operation(self, operation, *args) -> Any:
+        """
+        Await an API coroutine, retrying on API errors.
+        
+        Args:
+            operation: Coroutine function to call
+            *args: Arguments for the operation
+            
+        Returns:
+            Result of the operation
+            
+        Raises:
+            ValidationError: If the input is invalid; raised without retrying
+            APIError: If the operation still fails after the final retry
+        """
+        for attempt in range(1, SETTINGS.MAX_RETRIES + 1):
+            try:
+                return await operation(*args)
+            except ValidationError:
+                # Invalid input fails the same way on every attempt
+                raise
+            except APIError as e:
+                if attempt == SETTINGS.MAX_RETRIES:
+                    raise
+                self.logger.warning(
+                    f"Attempt {attempt} failed: {str(e)}. Retrying in {SETTINGS.RETRY_DELAY}s"
+                )
+                await asyncio.sleep(SETTINGS.RETRY_DELAY)
+
     def _get_or_create_domain_id(self) -> Optional[int]:
         """
         Get existing domain ID or create new domain entry.
@@ -125,65 +266,89 @@ class DomainMetricsCollector(BaseCollector):
         Returns:
             Domain ID if successful, None otherwise
         """
+        if self._domain_id is not None:
+            return self._domain_id
+        
         try:
-            with self.db.get_connection() as conn:
+            # Upsert so the lookup and the insert share one round-trip and
+            # concurrent collectors cannot both insert the domain
+            with self.db.connection() as conn:
                 with conn.cursor() as cur:
-                    # Try to get existing domain ID
-                    cur.execute(
-                        "SELECT id FROM domains WHERE domain = %s",
-                        (self.domain,)
-                    )
-                    result = cur.fetchone()
+                    execute_prepared(cur, 'upsert_domain_id', (self.domain,))
+                    self._domain_id = cur.fetchone()[0]
+                    return self._domain_id
                     
+        except Exception as e:
+            self.logger.error(f"Failed to get/create domain ID: {str(e)}")
+            return None
+
+    def _get_domain_id(self) -> Optional[int]:
+        """
+        Look up the domain ID without creating a domain entry.
+        
+        Returns:
+            Domain ID if the domain is known, None otherwise
+        """
+        if self._domain_id is not None:
+            return self._domain_id
+        
+        try:
+            with self.db.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT id FROM domains WHERE domain = %s", (self.domain,))
+                    result = cur.fetchone()
                     if result:
-                        return result[0]
-                    
-                    # Create new domain entry
-                    cur.execute(
-                        "INSERT INTO domains (domain) VALUES (%s) RETURNING id",
-                        (self.domain,)
-                    )
-                    conn.commit()
-                    return cur.fetchone()[0]
+                        self._domain_id = result[0]
+                    return self._domain_id
                     
         except Exception as e:
-            self.logger.error(f"Failed to get/create domain ID: {str(e)}")
+            self.logger.error(f"Failed to get domain ID: {str(e)}")
             return None
 
     def get_historical_metrics(
         self,
         start_date: datetime,
         end_date: datetime
-    ) -> Optional[List[Dict[str, Any]]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Get historical domain metrics.
+        Stream historical domain metrics.
+        
+        Rows are read through a server-side cursor, so memory stays bounded
+        for long date ranges; wrap the result in list() if all rows are
+        needed at once. The pooled connection is held until the iterator is
+        exhausted or closed.
         
         Args:
             start_date: Start date for historical data
             end_date: End date for historical data
             
-        Returns:
-            List of historical metrics if successful, None otherwise
+        Yields:
+            Historical metrics rows, oldest first
+            
+        Raises:
+            QueryError: If the query fails
+        """
+        domain_id = self._get_domain_id()
+        if not domain_id:
+            return
+        
+        query = """
+            SELECT * FROM semrush_domain_metrics
+            WHERE domain_id = %s
+            AND date BETWEEN %s AND %s
+            ORDER BY date
         """
+        
         try:
-            query = """
-                SELECT * FROM semrush_domain_metrics
-                WHERE domain_id = (
-                    SELECT id FROM domains WHERE domain = %s
-                )
-                AND date BETWEEN %s AND %s
-                ORDER BY date
-            """
-            
-            with self.db.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(query, (self.domain, start_date, end_date))
-                    columns = [desc[0] for desc in cur.description]
-                    return [dict(zip(columns, row)) for row in cur.fetchall()]
+            with self.db.connection() as conn:
+                with conn.cursor(name='hist_metrics') as cur:
+                    cur.execute(query, (domain_id, start_date, end_date))
+                    for row in cur:
+                        yield dict(row)
                     
-        except Exception as e:
+        except psycopg2.Error as e:
             self.logger.error(f"Failed to get historical metrics: {str(e)}")
-            return None
+            raise QueryError(f"Failed to get historical metrics: {str(e)}", query=query)
 
     def get_latest_metrics(self) -> Optional[Dict[str, Any]]:
         """
@@ -193,24 +358,15 @@ class DomainMetricsCollector(BaseCollector):
             Latest metrics if available, None otherwise
         """
         try:
-            query = """
-                SELECT * FROM semrush_domain_metrics
-                WHERE domain_id = (
-                    SELECT id FROM domains WHERE domain = %s
-                )
-                ORDER BY date DESC
-                LIMIT 1
-            """
+            domain_id = self._get_domain_id()
+            if not domain_id:
+                return None
             
-            with self.db.get_connection() as conn:
+            with self.db.connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(query, (self.domain,))
+                    execute_prepared(cur, 'latest_metrics', (domain_id,))
                     result = cur.fetchone()
-                    
-                    if result:
-                        columns = [desc[0] for desc in cur.description]
-                        return dict(zip(columns, result))
-                    return None
+                    return dict(result) if result else None
                     
         except Exception as e:
             self.logger.error(f"Failed to get latest metrics: {str(e)}")
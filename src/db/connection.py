@@ -1,30 +1,89 @@
 """Database connection pool management."""
 
+import atexit
+import functools
 import os
-import threading
+from contextlib import contextmanager
 from typing import Optional
 from urllib.parse import urlparse
 import psycopg2
+import psycopg2.extensions
 from psycopg2 import pool
 from psycopg2.extras import DictCursor
 
 from src.exceptions.errors import DatabaseConnectionError, ConfigurationError
 from src.config.logging import get_logger
+from src.config.settings import SETTINGS
 
 logger = get_logger(__name__)
 
-class ConnectionManager:
-    """Manages database connections using a connection pool."""
+# Statements prepared per pooled connection on first use so repeated
+# queries skip parsing and planning; run them with execute_prepared()
+PREPARED_STATEMENTS = {
+    'upsert_domain_id': """
+        INSERT INTO domains (domain) VALUES (%s)
+        ON CONFLICT (domain) DO UPDATE SET domain = EXCLUDED.domain
+        RETURNING id
+    """,
+    # Columns are listed so an ALTER TABLE cannot change the cached plan's
+    # result type
+    'latest_metrics': """
+        SELECT id, date, domain_id, organic_traffic, paid_traffic,
+               organic_keywords, paid_keywords, organic_traffic_cost,
+               paid_traffic_cost, domain_authority, backlink_count,
+               referring_domains, created_at
+        FROM semrush_domain_metrics
+        WHERE domain_id = %s
+        ORDER BY date DESC
+        LIMIT 1
+    """
+}
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """Connection that remembers which PREPARED_STATEMENTS it has prepared."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Statement name -> True if prepared, False if PREPARE failed
+        self.prepared = {}
+
+def execute_prepared(cur, name: str, params: tuple) -> None:
+    """
+    Execute one of PREPARED_STATEMENTS, preparing it on first use.
+    
+    If PREPARE fails (e.g. the table or a constraint is missing) the error
+    is logged and the statement runs unprepared on that connection from
+    then on, so only the query that needs it is affected.
     
-    _instance = None
-    _lock = threading.Lock()
+    Args:
+        cur: Cursor of a PreparingConnection
+        name: Key in PREPARED_STATEMENTS
+        params: Statement parameters
+    """
+    query = PREPARED_STATEMENTS[name]
+    prepared = cur.connection.prepared
+    if name not in prepared:
+        # A failed PREPARE aborts the transaction, so isolate it
+        cur.execute("SAVEPOINT prepare_statement")
+        try:
+            placeholders = tuple(f"${i}" for i in range(1, len(params) + 1))
+            cur.execute(f"PREPARE {name} AS {query % placeholders}")
+        except psycopg2.Error as e:
+            cur.execute("ROLLBACK TO SAVEPOINT prepare_statement")
+            logger.warning(f"Failed to prepare statement {name}, running it unprepared: {str(e)}")
+            prepared[name] = False
+        else:
+            cur.execute("RELEASE SAVEPOINT prepare_statement")
+            prepared[name] = True
     
-    def __new__(cls, *args, **kwargs):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-            return cls._instance
+    if prepared[name]:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(query, params)
 
+class ConnectionManager:
+    """Manages database connections using a connection pool."""
+    
     def __init__(self, db_url: Optional[str] = None, min_conn: int = 1, max_conn: int = 10):
         """
         Initialize the connection manager.
@@ -34,16 +93,14 @@ class ConnectionManager:
             min_conn: Minimum number of connections in pool
             max_conn: Maximum number of connections in pool
         """
-        if not hasattr(self, 'initialized'):
-            self.db_url = db_url or os.getenv('DATABASE_URL')
-            if not self.db_url:
-                raise ConfigurationError("DATABASE_URL environment variable is required")
-            
-            self.min_conn = min_conn
-            self.max_conn = max_conn
-            self.db_params = self._parse_db_url()
-            self.pool = self._create_pool()
-            self.initialized = True
+        self.db_url = db_url or os.getenv('DATABASE_URL')
+        if not self.db_url:
+            raise ConfigurationError("DATABASE_URL environment variable is required")
+        
+        self.min_conn = min_conn
+        self.max_conn = max_conn
+        self.db_params = self._parse_db_url()
+        self.pool = self._create_pool()
 
     def _parse_db_url(self) -> dict:
         """
@@ -73,7 +130,7 @@ class ConnectionManager:
         Create a new connection pool.
         
         Returns:
-            ThreadedConnectionPool instance
+            ThreadedConnectionPool of PreparingConnection connections
         
         Raises:
             DatabaseConnectionError: If pool creation fails
@@ -83,6 +140,7 @@ class ConnectionManager:
                 minconn=self.min_conn,
                 maxconn=self.max_conn,
                 **self.db_params,
+                connection_factory=PreparingConnection,
                 cursor_factory=DictCursor
             )
         except psycopg2.Error as e:
@@ -103,6 +161,30 @@ class ConnectionManager:
         except psycopg2.Error as e:
             raise DatabaseConnectionError(f"Failed to get connection from pool: {str(e)}")
 
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection from the pool for the duration of a with block.
+        
+        The transaction is committed when the block completes and rolled back
+        if it raises; either way the connection is returned to the pool.
+        
+        Yields:
+            Database connection
+            
+        Raises:
+            DatabaseConnectionError: If getting connection fails
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self.return_connection(conn)
+
     def return_connection(self, conn):
         """
         Return a connection to the pool.
@@ -116,13 +198,41 @@ class ConnectionManager:
             logger.error(f"Error returning connection to pool: {str(e)}")
 
     def close_all_connections(self):
-        """Close all connections in the pool."""
+        """Close all connections in the pool; safe to call more than once."""
         try:
-            if hasattr(self, 'pool'):
+            if hasattr(self, 'pool') and not self.pool.closed:
                 self.pool.closeall()
         except psycopg2.Error as e:
             logger.error(f"Error closing connection pool: {str(e)}")
 
-    def __del__(self):
-        """Cleanup on object destruction."""
+    def close(self):
+        """Close the connection pool."""
         self.close_all_connections()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit, closing the connection pool."""
+        self.close()
+
+@functools.lru_cache(maxsize=1)
+def get_connection_manager() -> ConnectionManager:
+    """
+    Get the process-wide connection manager, creating it on first call.
+    
+    The pool is only opened when first needed, so importing this module
+    never connects to the database.
+    
+    Returns:
+        Shared ConnectionManager instance
+    """
+    manager = ConnectionManager(
+        SETTINGS.DATABASE_URL,
+        SETTINGS.DB_MIN_CONNECTIONS,
+        SETTINGS.DB_MAX_CONNECTIONS
+    )
+    # Close the pool at interpreter exit rather than relying on __del__
+    atexit.register(manager.close_all_connections)
+    return manager
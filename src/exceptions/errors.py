@@ -45,6 +45,10 @@ class ValidationError(BaseError):
     """Raised when data validation fails."""
     pass
 
+class DomainValidationError(APIError, ValidationError):
+    """Raised when an API request is made for a malformed domain."""
+    pass
+
 class DataProcessingError(BaseError):
     """Raised when there's an error processing data."""
     def __init__(self, message: str, data: dict = None):
@@ -1,32 +1,110 @@
 """Data transformation utilities for SEMrush data."""
 
+import functools
 from typing import Dict, Any, List, Union, Optional
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
 import re
-from decimal import Decimal, InvalidOperation
 
-from logging_setup import get_logger
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # optional; only needed for normalize_metrics_batch
+    np = pd = None
+
+from src.config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Patterns used on every parsed value, compiled once at import
+_TRAFFIC_RE = re.compile(r'^([\d.]+)([kmb])?$')
+
+# Translation table deleting currency symbols and thousands separators
+_CCY_STRIP = str.maketrans('', '', '$€£,')
+
+# Precision of the NUMERIC(10,2) cost columns
+_CENT = Decimal('0.01')
+
+# Metrics fields normalized by value type
+_TRAFFIC_FIELDS = ('organic_traffic', 'paid_traffic', 'total_traffic')
+_COST_FIELDS = ('traffic_cost', 'organic_traffic_cost', 'paid_traffic_cost')
+_PERCENTAGE_FIELDS = ('market_share', 'visibility_score', 'engagement_rate')
+
+# Translation table deleting separators and lowercasing unit suffixes; other
+# letters only ever appear in values float() parses case-insensitively
+_TRAFFIC_NORMALIZE = str.maketrans({'K': 'k', 'M': 'm', 'B': 'b', ',': None, ' ': None})
+
+# Named constants for the strings the parse/format helpers compare against
+# or return, so each value is spelled out in one place
+_NA = 'n/a'
+_ONE = '1'
+_ZERO = '0'
+
+# Unit multipliers for converting string representations
+_UNIT_MULTIPLIERS = {
+    'k': 1000,
+    'm': 1000000,
+    'b': 1000000000
+}
+
+def _clean_domain(domain: str) -> str:
+    """Clean a domain name."""
+    try:
+        # Strip the fixed protocol and www prefixes with string methods; a
+        # regex is not needed for a literal prefix
+        cleaned = domain.lower().strip()
+        cleaned = cleaned.removeprefix('https://').removeprefix('http://').removeprefix('www.')
+        
+        # Remove trailing slashes and paths, then whitespace left before them
+        return cleaned.partition('/')[0].strip()
+    except Exception as e:
+        logger.warning(f"Failed to clean domain '{domain}': {str(e)}")
+        return domain
+
+# Memoized since the same domain repeats across rows; only for str input,
+# as other values may be unhashable
+_clean_domain_cached = functools.lru_cache(maxsize=65536)(_clean_domain)
+
+def _join_values(value) -> str:
+    """Convert a list or tuple to a comma-separated string."""
+    return ','.join(str(v) for v in value)
+
+def _format_date(value: datetime) -> str:
+    """Convert a date to the API's required format."""
+    return value.strftime('%Y-%m-%d')
+
+def _format_bool(value: bool) -> str:
+    """Convert a boolean to 1/0."""
+    return _ONE if value else _ZERO
+
+def _format_value(value: Any) -> str:
+    """Format an API parameter whose exact type has no entry in _FORMATTERS."""
+    if isinstance(value, (list, tuple)):
+        return _join_values(value)
+    if isinstance(value, datetime):
+        return _format_date(value)
+    if isinstance(value, bool):
+        return _format_bool(value)
+    return str(value)
+
+# API parameter formatters keyed by exact type, so common values need one
+# dict lookup instead of an isinstance chain; subclasses and other types fall
+# back to _format_value
+_FORMATTERS = {
+    str: str,
+    int: str,
+    float: str,
+    bool: _format_bool,
+    datetime: _format_date,
+    list: _join_values,
+    tuple: _join_values
+}
+
 class DataTransformer:
     """Handles data transformation and normalization."""
     
-    def __init__(self):
-        """Initialize data transformer."""
-        # Common patterns for data cleaning
-        self.patterns = {
-            'url': re.compile(r'^(https?:\/\/)?([\da-z\.-]+)\.([a-z\.]{2,6})([\/\w \.-]*)*\/?$'),
-            'domain': re.compile(r'^([\da-z\.-]+)\.([a-z\.]{2,6})$'),
-            'number': re.compile(r'^-?\d*\.?\d+$')
-        }
-        
-        # Unit multipliers for converting string representations
-        self.unit_multipliers = {
-            'k': 1000,
-            'm': 1000000,
-            'b': 1000000000
-        }
+    # Stateless: patterns and unit multipliers are module-level constants
+    __slots__ = ()
 
     def clean_domain(self, domain: str) -> str:
         """
@@ -42,18 +120,9 @@ class DataTransformer:
             >>> clean_domain('https://example.com/')
             'example.com'
         """
-        try:
-            # Remove protocol and www if present
-            domain = re.sub(r'https?://', '', domain.lower())
-            domain = re.sub(r'^www\.', '', domain)
-            
-            # Remove trailing slashes and paths
-            domain = domain.split('/')[0]
-            
-            return domain.strip()
-        except Exception as e:
-            logger.warning(f"Failed to clean domain '{domain}': {str(e)}")
-            return domain
+        if isinstance(domain, str):
+            return _clean_domain_cached(domain)
+        return _clean_domain(domain)
 
     def parse_traffic_value(self, value: str) -> Optional[int]:
         """
@@ -70,14 +139,18 @@ class DataTransformer:
             1500
         """
         try:
-            if not value or value.lower() == 'n/a':
+            if not value or value.lower() == _NA:
                 return None
                 
-            # Remove any commas and spaces
-            value = value.replace(',', '').replace(' ', '').lower()
+            # Remove any commas and spaces and lowercase the unit in one pass
+            value = value.translate(_TRAFFIC_NORMALIZE)
+            
+            # Plain numbers are the common case and need no regex
+            if value[-1:] not in ('k', 'm', 'b'):
+                return int(float(value))
             
             # Extract number and unit
-            match = re.match(r'^([\d.]+)([kmb])?$', value.lower())
+            match = _TRAFFIC_RE.match(value)
             if not match:
                 return int(float(value))
                 
@@ -85,7 +158,7 @@ class DataTransformer:
             number = float(number)
             
             if unit:
-                number *= self.unit_multipliers.get(unit, 1)
+                number *= _UNIT_MULTIPLIERS.get(unit, 1)
                 
             return int(number)
             
@@ -108,7 +181,7 @@ class DataTransformer:
             15.5
         """
         try:
-            if not value or value.lower() == 'n/a':
+            if not value or value.lower() == _NA:
                 return None
                 
             # Remove % sign and any spaces
@@ -127,21 +200,22 @@ class DataTransformer:
             value: Currency amount string
             
         Returns:
-            Parsed decimal value
+            Parsed decimal value, rounded half up to the cent like the
+            NUMERIC(10,2) cost columns
             
         Example:
             >>> parse_currency_amount('$1,234.56')
             Decimal('1234.56')
         """
         try:
-            if not value or value.lower() == 'n/a':
+            if not value or value.lower() == _NA:
                 return None
                 
-            # Remove currency symbols and commas
-            value = re.sub(r'[$€£,]', '', value)
-            return Decimal(value)
+            # Remove currency symbols, commas and surrounding whitespace
+            value = value.translate(_CCY_STRIP).strip()
+            return Decimal(value).quantize(_CENT, rounding=ROUND_HALF_UP)
             
-        except (InvalidOperation, ValueError) as e:
+        except (ValueError, ArithmeticError) as e:
             logger.warning(f"Failed to parse currency amount '{value}': {str(e)}")
             return None
 
@@ -185,6 +259,47 @@ class DataTransformer:
             logger.error(f"Failed to normalize keyword data: {str(e)}")
             return data
 
+    def normalize_keyword_batch(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize many keyword rows at once.
+        
+        Equivalent to normalize_keyword_data() per row, but each known field
+        is parsed as a column with the parser looked up once. Batches whose
+        rows do not all carry the known fields, or contain values the column
+        pass cannot parse, fall back to per-row normalization.
+        
+        Args:
+            rows: Raw keyword data dictionaries
+            
+        Returns:
+            Normalized data dictionaries, in input order
+        """
+        parse_traffic = self.parse_traffic_value
+        parse_currency = self.parse_currency_amount
+        parse_percentage = self.parse_percentage
+        
+        try:
+            keywords = list(map(str.lower, [row['keyword'] for row in rows]))
+            volumes = [parse_traffic(str(row['search_volume'])) for row in rows]
+            positions = [int(p) if p else None for p in [row['position'] for row in rows]]
+            cpcs = [parse_currency(str(row['cpc'])) for row in rows]
+            competitions = [parse_percentage(str(row['competition'])) for row in rows]
+        except (KeyError, TypeError, ValueError):
+            return [self.normalize_keyword_data(row) for row in rows]
+        
+        return [
+            {
+                **row,
+                'keyword': keyword,
+                'search_volume': volume,
+                'position': position,
+                'cpc': cpc,
+                'competition': competition,
+            }
+            for row, keyword, volume, position, cpc, competition
+            in zip(rows, keywords, volumes, positions, cpcs, competitions)
+        ]
+
     def normalize_metrics_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize metrics data structure.
@@ -199,20 +314,17 @@ class DataTransformer:
         
         try:
             # Normalize traffic metrics
-            traffic_fields = ['organic_traffic', 'paid_traffic', 'total_traffic']
-            for field in traffic_fields:
+            for field in _TRAFFIC_FIELDS:
                 if field in data:
                     normalized[field] = self.parse_traffic_value(str(data[field]))
             
             # Normalize cost metrics
-            cost_fields = ['traffic_cost', 'organic_traffic_cost', 'paid_traffic_cost']
-            for field in cost_fields:
+            for field in _COST_FIELDS:
                 if field in data:
                     normalized[field] = self.parse_currency_amount(str(data[field]))
             
             # Normalize percentage metrics
-            percentage_fields = ['market_share', 'visibility_score', 'engagement_rate']
-            for field in percentage_fields:
+            for field in _PERCENTAGE_FIELDS:
                 if field in data:
                     normalized[field] = self.parse_percentage(str(data[field]))
             
@@ -227,6 +339,66 @@ class DataTransformer:
             logger.error(f"Failed to normalize metrics data: {str(e)}")
             return data
 
+    def normalize_metrics_batch(self, df: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Normalize many metrics rows at once.
+        
+        Vectorized equivalent of normalize_metrics_data() for a DataFrame
+        with one row per record: traffic and percentage columns are parsed
+        with pandas string/numeric kernels instead of per-value calls.
+        Unparseable traffic and percentage values become missing (<NA>/NaN)
+        rather than None.
+        
+        Args:
+            df: Raw metrics data, one column per field
+            
+        Returns:
+            Normalized copy of df
+            
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        if pd is None:
+            raise ImportError("normalize_metrics_batch requires pandas")
+        
+        df = df.copy()
+        
+        # Normalize traffic metrics: strip separators, then scale by the
+        # optional K/M/B suffix
+        for field in _TRAFFIC_FIELDS:
+            if field not in df:
+                continue
+            values = (
+                df[field].astype(str)
+                .str.replace(',', '', regex=False)
+                .str.replace(' ', '', regex=False)
+                .str.lower()
+            )
+            units = values.str[-1]
+            has_unit = units.isin(list(_UNIT_MULTIPLIERS))
+            numbers = values.where(~has_unit, values.str[:-1])
+            numbers = numbers.where(~has_unit | numbers.str.fullmatch(r'[\d.]+'), None)
+            parsed = pd.to_numeric(numbers, errors='coerce') * units.map(_UNIT_MULTIPLIERS).fillna(1)
+            # Truncate like int(); infinities cannot be stored as integers
+            parsed = parsed.where(~np.isinf(parsed))
+            df[field] = np.trunc(parsed).astype('Int64')
+        
+        # Normalize cost metrics to Decimal dollars; parsed per value so
+        # amounts never round-trip through float
+        for field in _COST_FIELDS:
+            if field in df:
+                df[field] = df[field].map(lambda value: self.parse_currency_amount(str(value)))
+        
+        # Normalize percentage metrics
+        for field in _PERCENTAGE_FIELDS:
+            if field in df:
+                df[field] = pd.to_numeric(
+                    df[field].astype(str).str.replace('%', '', regex=False).str.strip(),
+                    errors='coerce'
+                )
+        
+        return df
+
     def format_api_parameters(self, params: Dict[str, Any]) -> Dict[str, str]:
         """
         Format parameters for API requests.
@@ -241,17 +413,7 @@ class DataTransformer:
         
         try:
             for key, value in params.items():
-                # Convert lists to comma-separated strings
-                if isinstance(value, (list, tuple)):
-                    formatted[key] = ','.join(str(v) for v in value)
-                # Convert dates to required format
-                elif isinstance(value, datetime):
-                    formatted[key] = value.strftime('%Y-%m-%d')
-                # Convert booleans to 1/0
-                elif isinstance(value, bool):
-                    formatted[key] = '1' if value else '0'
-                else:
-                    formatted[key] = str(value)
+                formatted[key] = _FORMATTERS.get(type(value), _format_value)(value)
                     
             return formatted
             
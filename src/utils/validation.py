@@ -1,47 +1,287 @@
 """Validation utilities for SEMrush data."""
 
+import functools
+import numbers
 import re
-from typing import Any, Dict, List, Optional, Union
+from bisect import bisect_left
+from calendar import monthrange
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, date
+from decimal import Decimal
 import ipaddress
 from urllib.parse import urlparse
 
-from logging_setup import get_logger
+try:
+    import numpy as np
+except ImportError:  # optional; only needed for validate_ranges_batch
+    np = None
+
+from src.config.logging import get_logger
 
 logger = get_logger(__name__)
 
+def _check_ranges(values, mins, maxs, out):
+    """Flag values within their column's range; NaN (missing) values pass."""
+    rows, cols = values.shape
+    for i in range(rows):
+        for j in range(cols):
+            x = values[i, j]
+            out[i, j] = x != x or (mins[j] <= x and x <= maxs[j])
+
+@functools.lru_cache(maxsize=1)
+def _range_kernel():
+    """
+    Compile _check_ranges with Numba on first use.
+    
+    Deferred so importing this module never loads Numba.
+    
+    Returns:
+        The compiled kernel, or None when Numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:  # optional; the range check then runs as NumPy expressions
+        return None
+    return njit(cache=True)(_check_ranges)
+
+# Compiled patterns
+_DOMAIN_RE = re.compile(
+    r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+(?:[a-zA-Z]{2,}|xn--[a-zA-Z0-9-]{1,59})$'
+)
+_EMAIL_RE = re.compile(
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+)
+# Matched against lowercased input, so no IGNORECASE case folding
+_URL_RE = re.compile(
+    r'^https?:\/\/'
+    r'(?:(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,6}\.?|[a-z0-9-]{2,}\.?)|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$'
+)
+
+# Bound match functions, so hot paths skip the attribute lookup
+_DOMAIN_RE_match = _DOMAIN_RE.match
+_URL_RE_match = _URL_RE.match
+
+# Validation ranges
+_RANGES = {
+    'position': (1, 100),
+    'search_volume': (0, 1000000000),
+    'traffic': (0, 1000000000),
+    'percentage': (0, 100),
+    'year': (2000, datetime.now().year + 1)
+}
+
+# Value types compared against a range; numbers.Real also covers NumPy
+# integer and floating scalars
+_NUMERIC_TYPES = (numbers.Real, Decimal)
+
+# Range bounds packed into arrays, one slot per range key, for the batch
+# range check
+if np is not None:
+    _RANGE_SLOTS = {key: slot for slot, key in enumerate(_RANGES)}
+    _RANGE_MINS = np.array([lo for lo, _ in _RANGES.values()], dtype=np.float64)
+    _RANGE_MAXS = np.array([hi for _, hi in _RANGES.values()], dtype=np.float64)
+
+# SEMrush API V3 keyword fields, required by default; bit i of a keyword
+# error mask flags field i as missing or invalid
+KEYWORD_FIELDS = (
+    'Keyword', 'Position', 'SearchVolume', 'CPC', 'Competition',
+    'NumberOfResults', 'Trends', 'URL', 'Traffic', 'TrafficCost'
+)
+KEYWORD_FIELD_BITS = {field: 1 << i for i, field in enumerate(KEYWORD_FIELDS)}
+
+# Messages for invalid keyword field values, in reporting order
+_KEYWORD_INVALID_MESSAGES = {
+    'Position': "Invalid position value: {}",
+    'SearchVolume': "Invalid search volume: {}",
+    'CPC': "Invalid CPC value: {}",
+    'Competition': "Invalid competition value: {}",
+    'NumberOfResults': "Invalid number of results: {}",
+    'URL': "Invalid URL: {}",
+    'Traffic': "Invalid Traffic value: {}",
+    'TrafficCost': "Invalid TrafficCost value: {}"
+}
+
+@functools.lru_cache(maxsize=1)
+def _batch_db():
+    """
+    Compile the domain and URL patterns into a Hyperscan database on first use.
+    
+    Both patterns share one database so a batch is validated in a single
+    scan; building it is deferred so importing this module never loads or
+    compiles Hyperscan.
+    
+    Returns:
+        Hyperscan block-mode database, where match ids 0 and 1 are domain
+        and URL, or None when Hyperscan is not installed
+    """
+    try:
+        import hyperscan
+    except ImportError:  # optional; batch validation falls back to re
+        return None
+    
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[_DOMAIN_RE.pattern.encode(), _URL_RE.pattern.encode()],
+        ids=[0, 1],
+        # Multiline anchors make ^ and $ match at each item boundary; the
+        # single-item checks lowercase their input, so neither pattern is
+        # case-sensitive
+        flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_CASELESS] * 2
+    )
+    return db
+
+def _validate_domain(domain: str) -> bool:
+    """Validate a domain name."""
+    try:
+        if not domain:
+            return False
+        # Domains are usually lowercase already (e.g. after clean_domain);
+        # islower() avoids allocating a copy for them
+        if not domain.islower():
+            domain = domain.lower()
+        return bool(_DOMAIN_RE_match(domain))
+    except Exception as e:
+        logger.error(f"Domain validation error for '{domain}': {str(e)}")
+        return False
+
+# Memoized since the same domain repeats across rows; only for str input,
+# as other values may be unhashable
+_validate_domain_cached = functools.lru_cache(maxsize=65536)(_validate_domain)
+
+def _range_check_lines(field: str, range_key: str, on_invalid: str) -> List[str]:
+    """
+    Generate source lines checking one field against a range.
+    
+    The bounds are inlined as constants; a non-numeric value is invalid,
+    as in validate_numeric_range().
+    
+    Args:
+        field: Field name to read from the record ``d``
+        range_key: Key into _RANGES
+        on_invalid: Statement to run when the value is out of range
+        
+    Returns:
+        Indented source lines
+    """
+    min_val, max_val = _RANGES[range_key]
+    return [
+        f"    x = get({field!r})",
+        f"    if x is not None and not (isinstance(x, _NUMERIC_TYPES) and {min_val!r} <= x <= {max_val!r}):",
+        f"        {on_invalid}",
+    ]
+
+def _compile_validator(name: str, lines: List[str]):
+    """
+    Compile generated validator source into a function.
+    
+    Args:
+        name: Function name
+        lines: Function body source lines
+        
+    Returns:
+        The compiled function, taking (record, helper)
+    """
+    source = f"def {name}(d, helper):\n    get = d.get\n" + "\n".join(lines) + "\n"
+    namespace = {
+        '_NUMERIC_TYPES': _NUMERIC_TYPES,
+        'datetime': datetime,
+        'date': date
+    }
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+@functools.lru_cache(maxsize=32)
+def _keyword_mask_validator(required_fields: Tuple[str, ...]):
+    """
+    Build a keyword_error_mask() implementation specialized to required_fields.
+    
+    Args:
+        required_fields: Required field names
+        
+    Returns:
+        Function mapping (record, helper) to the error bitmask
+    """
+    lines = ["    mask = 0"]
+    
+    # Check required fields
+    for index, field in enumerate(required_fields):
+        bit = ValidationHelper.keyword_field_bit(field, required_fields, index)
+        lines.append(f"    if get({field!r}) is None: mask |= {bit}")
+    
+    # Validate specific fields
+    bits = KEYWORD_FIELD_BITS
+    lines += _range_check_lines('Position', 'position', f"mask |= {bits['Position']}")
+    lines += _range_check_lines('SearchVolume', 'search_volume', f"mask |= {bits['SearchVolume']}")
+    lines += [
+        "    x = get('CPC')",
+        f"    if x is not None and (not isinstance(x, (int, float)) or x < 0): mask |= {bits['CPC']}",
+    ]
+    lines += _range_check_lines('Competition', 'percentage', f"mask |= {bits['Competition']}")
+    lines += [
+        "    x = get('NumberOfResults')",
+        f"    if x is not None and (not isinstance(x, int) or x < 0): mask |= {bits['NumberOfResults']}",
+        # 'Trends' would typically be a list of 12 numbers, but this isn't enforced here as formats can vary
+        "    x = get('URL')",
+        f"    if x and not helper.validate_url(x): mask |= {bits['URL']}",
+    ]
+    # Traffic and TrafficCost should be non-negative numbers
+    for field in ('Traffic', 'TrafficCost'):
+        lines += _range_check_lines(field, 'traffic', f"mask |= {bits[field]}")
+    lines.append("    return mask")
+    
+    return _compile_validator('keyword_error_mask', lines)
+
+@functools.lru_cache(maxsize=32)
+def _metrics_validator(required_fields: Tuple[str, ...]):
+    """
+    Build a validate_metrics_data() implementation specialized to required_fields.
+    
+    Args:
+        required_fields: Required field names
+        
+    Returns:
+        Function mapping (record, helper) to the list of validation errors
+    """
+    lines = ["    errors = []"]
+    
+    # Check required fields
+    for field in required_fields:
+        message = f"Missing required field: {field}"
+        lines.append(f"    if get({field!r}) is None: errors.append({message!r})")
+    
+    # Validate date field (SEMrush uses YYYYMMDD format)
+    lines += [
+        "    x = get('Date')",
+        "    if x:",
+        "        if isinstance(x, str):",
+        "            if not helper.validate_date_format(x, '%Y%m%d'):",
+        "                errors.append(f'Invalid date format: {x}')",
+        "        elif not isinstance(x, (datetime, date)):",
+        "            errors.append('Date must be string or datetime object')",
+    ]
+    
+    # Validate traffic fields, then percentage fields (Visibility is a percentage in SEMrush)
+    for field, range_key in (
+        ('OrganicTraffic', 'traffic'),
+        ('PaidTraffic', 'traffic'),
+        ('TotalTraffic', 'traffic'),
+        ('Visibility', 'percentage')
+    ):
+        message = f"Invalid {field} value: "
+        lines += _range_check_lines(field, range_key, f"errors.append({message!r} + str(x))")
+    lines.append("    return errors")
+    
+    return _compile_validator('validate_metrics_data', lines)
+
 class ValidationHelper:
     """Provides validation methods for various data types."""
     
-    def __init__(self):
-        """Initialize validation helper."""
-        # Compile regex patterns
-        self.patterns = {
-            'domain': re.compile(
-                r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$'
-            ),
-            'email': re.compile(
-                r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            ),
-            'url': re.compile(
-                r'^https?:\/\/'
-                r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|'
-                r'localhost|'
-                r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                r'(?::\d+)?'
-                r'(?:/?|[/?]\S+)$',
-                re.IGNORECASE
-            )
-        }
-        
-        # Define validation ranges
-        self.ranges = {
-            'position': (1, 100),
-            'search_volume': (0, 1000000000),
-            'traffic': (0, 1000000000),
-            'percentage': (0, 100),
-            'year': (2000, datetime.now().year + 1)
-        }
+    # Stateless: patterns and ranges are module-level constants
+    __slots__ = ()
 
     def validate_domain(self, domain: str) -> bool:
         """
@@ -53,13 +293,9 @@ class ValidationHelper:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            if not domain:
-                return False
-            return bool(self.patterns['domain'].match(domain.lower()))
-        except Exception as e:
-            logger.error(f"Domain validation error for '{domain}': {str(e)}")
-            return False
+        if isinstance(domain, str):
+            return _validate_domain_cached(domain)
+        return _validate_domain(domain)
 
     def validate_url(self, url: str) -> bool:
         """
@@ -72,13 +308,61 @@ class ValidationHelper:
             True if valid, False otherwise
         """
         try:
-            if not url:
+            # Reject anything without an http(s) scheme before entering the
+            # regex engine
+            if not url or not url[:8].lower().startswith(('http://', 'https://')):
                 return False
-            return bool(self.patterns['url'].match(url))
+            return bool(_URL_RE_match(url.lower()))
         except Exception as e:
             logger.error(f"URL validation error for '{url}': {str(e)}")
             return False
 
+    def validate_batch(self, items: List[str]) -> List[Tuple[bool, bool]]:
+        """
+        Validate many strings as both domains and URLs at once.
+        
+        With Hyperscan installed the whole batch is matched against both
+        patterns in one DFA scan; otherwise each item is checked with re.
+        
+        Args:
+            items: Strings to validate
+            
+        Returns:
+            (is_valid_domain, is_valid_url) for each item, in input order
+        """
+        batch_db = _batch_db()
+        if batch_db is None or any('\n' in item for item in items):
+            return [(self.validate_domain(item), self.validate_url(item)) for item in items]
+        
+        # Offset just past the end of each item in the newline-joined buffer
+        ends = []
+        offset = 0
+        for item in items:
+            offset += len(item.encode())
+            ends.append(offset)
+            offset += 1
+        
+        results = [[False, False] for _ in items]
+        
+        def on_match(pattern_id, start, end, flags, context):
+            # Anchored matches end at an item boundary
+            results[bisect_left(ends, end)][pattern_id] = True
+        
+        batch_db.scan('\n'.join(items).encode(), match_event_handler=on_match)
+        return [(domain_ok, url_ok) for domain_ok, url_ok in results]
+
+    def validate_domains(self, domains: List[str]) -> List[bool]:
+        """
+        Validate many domain names at once.
+        
+        Args:
+            domains: Domain names to validate
+            
+        Returns:
+            True for each valid domain, in input order
+        """
+        return [domain_ok for domain_ok, _ in self.validate_batch(domains)]
+
     def validate_numeric_range(
         self,
         value: Union[int, float],
@@ -94,17 +378,73 @@ class ValidationHelper:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            if range_key not in self.ranges:
-                logger.warning(f"Unknown range key: {range_key}")
-                return True
-                
-            min_val, max_val = self.ranges[range_key]
-            return min_val <= value <= max_val
-            
-        except TypeError as e:
-            logger.error(f"Numeric range validation error for '{value}': {str(e)}")
+        bounds = _RANGES.get(range_key)
+        if bounds is None:
+            logger.warning(f"Unknown range key: {range_key}")
+            return True
+        
+        # An explicit type check instead of catching TypeError from the
+        # comparison keeps this a plain arithmetic check
+        if not isinstance(value, _NUMERIC_TYPES):
             return False
+        
+        min_val, max_val = bounds
+        return min_val <= value <= max_val
+
+    def validate_ranges_batch(self, values, range_keys: List[str]):
+        """
+        Validate a batch of records' numeric fields against their ranges.
+        
+        Equivalent to validate_numeric_range() on every cell, but run as one
+        compiled loop (Numba when installed, otherwise NumPy).
+        
+        Args:
+            values: (N_records, N_fields) array-like of numbers; NaN (or None
+                in an object array) marks a missing value, which is not range
+                checked
+            range_keys: Range key for each field column
+            
+        Returns:
+            (N_records, N_fields) boolean array, True where the value is valid
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("validate_ranges_batch requires numpy")
+        
+        array = np.asarray(values)
+        if array.dtype.kind not in 'biuf':
+            # Strings or mixed objects: compare each original cell as
+            # validate_numeric_range() would rather than coercing it
+            values = np.array(values, dtype=object)
+            return np.array([
+                [
+                    cell is None or cell != cell or self.validate_numeric_range(cell, key)
+                    for cell, key in zip(row, range_keys)
+                ]
+                for row in values
+            ], dtype=np.bool_).reshape(values.shape)
+        values = array.astype(np.float64)
+        
+        # Unknown range keys accept any value, as in validate_numeric_range()
+        mins = np.full(len(range_keys), -np.inf)
+        maxs = np.full(len(range_keys), np.inf)
+        for column, key in enumerate(range_keys):
+            slot = _RANGE_SLOTS.get(key)
+            if slot is None:
+                logger.warning(f"Unknown range key: {key}")
+            else:
+                mins[column] = _RANGE_MINS[slot]
+                maxs[column] = _RANGE_MAXS[slot]
+        
+        kernel = _range_kernel()
+        if kernel is None:
+            return np.isnan(values) | ((values >= mins) & (values <= maxs))
+        
+        out = np.empty(values.shape, dtype=np.bool_)
+        kernel(values, mins, maxs, out)
+        return out
 
     def validate_date_format(
         self,
@@ -121,70 +461,120 @@ class ValidationHelper:
         Returns:
             True if valid, False otherwise
         """
+        # SEMrush dates are 8-digit YYYYMMDD strings; check those directly
+        # instead of running the strptime format interpreter
+        if format_str == '%Y%m%d' and len(date_str) == 8:
+            if not (date_str.isascii() and date_str.isdigit()):
+                return False
+            year, month, day = int(date_str[:4]), int(date_str[4:6]), int(date_str[6:])
+            return year >= 1 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]
+        
         try:
             datetime.strptime(date_str, format_str)
             return True
         except ValueError:
             return False
 
-    def validate_keyword_data(
+    def keyword_error_mask(
         self,
         data: Dict[str, Any],
         required_fields: Optional[List[str]] = None
-    ) -> List[str]:
+    ) -> int:
         """
-        Validate keyword data structure from SEMrush API V3.
+        Validate keyword data without building error messages.
         
         Args:
             data: Keyword data dictionary to validate
             required_fields: List of required field names
             
+        Returns:
+            Bitmask of the fields that are missing or invalid (0 if valid);
+            see keyword_field_bit() and format_keyword_errors()
+        """
+        # Straight-line validator generated once per required field list
+        required_fields = KEYWORD_FIELDS if required_fields is None else tuple(required_fields)
+        return _keyword_mask_validator(required_fields)(data, self)
+
+    @staticmethod
+    def keyword_field_bit(
+        field: str,
+        required_fields: Optional[List[str]] = None,
+        index: Optional[int] = None
+    ) -> int:
+        """
+        Get the error-mask bit for a keyword field.
+        
+        Args:
+            field: Field name
+            required_fields: Required field list the mask was built with
+            index: Position of field in required_fields, if known
+            
+        Returns:
+            The field's bit in KEYWORD_FIELD_BITS, or for a custom required
+            field a bit above those, chosen by its position in required_fields
+        """
+        bit = KEYWORD_FIELD_BITS.get(field)
+        if bit is not None:
+            return bit
+        if index is None:
+            index = required_fields.index(field)
+        return 1 << (len(KEYWORD_FIELDS) + index)
+
+    def format_keyword_errors(
+        self,
+        data: Dict[str, Any],
+        mask: int,
+        required_fields: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Build the error messages for a keyword_error_mask() result.
+        
+        Args:
+            data: Keyword data dictionary that was validated
+            mask: Bitmask returned by keyword_error_mask()
+            required_fields: List of required field names the mask was built with
+            
         Returns:
             List of validation errors (empty if valid)
         """
         errors = []
         
         if required_fields is None:
-            required_fields = ['Keyword', 'Position', 'SearchVolume', 'CPC', 'Competition', 'NumberOfResults', 'Trends', 'URL', 'Traffic', 'TrafficCost']
+            required_fields = KEYWORD_FIELDS
         
-        # Check required fields
-        for field in required_fields:
-            if field not in data or data[field] is None:
+        # A flagged field is missing if it has no value and invalid otherwise
+        for index, field in enumerate(required_fields):
+            if mask & self.keyword_field_bit(field, required_fields, index) and data.get(field) is None:
                 errors.append(f"Missing required field: {field}")
         
-        # Validate specific fields
-        if 'Position' in data and data['Position'] is not None:
-            if not self.validate_numeric_range(data['Position'], 'position'):
-                errors.append(f"Invalid position value: {data['Position']}")
-        
-        if 'SearchVolume' in data and data['SearchVolume'] is not None:
-            if not self.validate_numeric_range(data['SearchVolume'], 'search_volume'):
-                errors.append(f"Invalid search volume: {data['SearchVolume']}")
-        
-        if 'CPC' in data and data['CPC'] is not None:
-            if not isinstance(data['CPC'], (int, float)) or data['CPC'] < 0:
-                errors.append(f"Invalid CPC value: {data['CPC']}")
+        for field, message in _KEYWORD_INVALID_MESSAGES.items():
+            if mask & KEYWORD_FIELD_BITS[field] and data.get(field) is not None:
+                errors.append(message.format(data[field]))
         
-        if 'Competition' in data and data['Competition'] is not None:
-            if not self.validate_numeric_range(data['Competition'], 'percentage'):
-                errors.append(f"Invalid competition value: {data['Competition']}")
-        
-        if 'NumberOfResults' in data and data['NumberOfResults'] is not None:
-            if not isinstance(data['NumberOfResults'], int) or data['NumberOfResults'] < 0:
-                errors.append(f"Invalid number of results: {data['NumberOfResults']}")
-        
-        # 'Trends' would typically be a list of 12 numbers, but this isn't enforced here as formats can vary
-        if 'URL' in data and data['URL']:
-            if not self.validate_url(data['URL']):
-                errors.append(f"Invalid URL: {data['URL']}")
+        return errors
+
+    def validate_keyword_data(
+        self,
+        data: Dict[str, Any],
+        required_fields: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Validate keyword data structure from SEMrush API V3.
         
-        # Traffic and TrafficCost should be non-negative numbers
-        for field in ['Traffic', 'TrafficCost']:
-            if field in data and data[field] is not None:
-                if not self.validate_numeric_range(data[field], 'traffic'):
-                    errors.append(f"Invalid {field} value: {data[field]}")
+        Use keyword_error_mask() directly when only validity matters; no
+        messages are built for valid rows either way.
         
-        return errors
+        Args:
+            data: Keyword data dictionary to validate
+            required_fields: List of required field names
+            
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        mask = self.keyword_error_mask(data, required_fields)
+        if not mask:
+            return []
+        return self.format_keyword_errors(data, mask, required_fields)
 
     def validate_metrics_data(
         self,
@@ -201,39 +591,9 @@ class ValidationHelper:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        
-        if required_fields is None:
-            required_fields = ['Date']
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                errors.append(f"Missing required field: {field}")
-        
-        # Validate date field
-        if 'Date' in data and data['Date']:
-            if isinstance(data['Date'], str):
-                if not self.validate_date_format(data['Date'], '%Y%m%d'):  # SEMrush uses YYYYMMDD format
-                    errors.append(f"Invalid date format: {data['Date']}")
-            elif not isinstance(data['Date'], (datetime, date)):
-                errors.append("Date must be string or datetime object")
-        
-        # Validate traffic fields
-        traffic_fields = ['OrganicTraffic', 'PaidTraffic', 'TotalTraffic']
-        for field in traffic_fields:
-            if field in data and data[field] is not None:
-                if not self.validate_numeric_range(data[field], 'traffic'):
-                    errors.append(f"Invalid {field} value: {data[field]}")
-        
-        # Validate percentage fields (Visibility is a percentage in SEMrush)
-        percentage_fields = ['Visibility']
-        for field in percentage_fields:
-            if field in data and data[field] is not None:
-                if not self.validate_numeric_range(data[field], 'percentage'):
-                    errors.append(f"Invalid {field} value: {data[field]}")
-        
-        return errors
+        # Straight-line validator generated once per required field list
+        required_fields = ('Date',) if required_fields is None else tuple(required_fields)
+        return _metrics_validator(required_fields)(data, self)
 
     def validate_competitor_data(self, data: Dict[str, Any]) -> List[str]:
         """
@@ -0,0 +1,87 @@
+"""Tests for the API response cache."""
+
+import gzip
+import pytest
+from src.api import cache as cache_module
+from src.api.cache import FileCache
+from src.api.semrush_client import SEMrushAPIV3Client
+
+@pytest.fixture
+def file_cache(tmp_path):
+    """Create a file cache in a temporary directory."""
+    return FileCache(str(tmp_path), ttl_seconds=60)
+
+def test_round_trip(file_cache):
+    """Test stored data is returned on a later lookup."""
+    key = FileCache.make_key('domain_overview', 'example.com', 'us', '2024-01-01', 'key')
+    assert file_cache.get('domain_overview', key) is None
+    file_cache.set('domain_overview', key, {'result': 'success'})
+    assert file_cache.get('domain_overview', key) == {'result': 'success'}
+
+def test_key_covers_request_fields():
+    """Test every request field changes the key."""
+    base = ('domain_overview', 'example.com', 'us', '2024-01-01', 'key-a')
+    keys = {FileCache.make_key(*base)}
+    for i, value in enumerate(['backlinks_overview', 'example.org', 'uk', '2024-01-02', 'key-b']):
+        fields = list(base)
+        fields[i] = value
+        keys.add(FileCache.make_key(*fields))
+    assert len(keys) == 6
+
+def test_entries_expire(file_cache, monkeypatch):
+    """Test entries older than the TTL are treated as missing."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    file_cache.set('domain_overview', 'key', {'result': 'success'})
+    now[0] += 59
+    assert file_cache.get('domain_overview', 'key') is not None
+    now[0] += 1
+    assert file_cache.get('domain_overview', 'key') is None
+
+def test_corrupt_entry_is_a_miss(file_cache, tmp_path):
+    """Test an unreadable cache file does not break the lookup."""
+    path = tmp_path / 'domain_overview' / 'key.json.gz'
+    path.parent.mkdir()
+    path.write_bytes(b'not gzip')
+    assert file_cache.get('domain_overview', 'key') is None
+
+@pytest.mark.parametrize("content", [b'[1, 2]', b'{"data": {}}', b'{"_ts": "now", "data": {}}'])
+def test_malformed_entry_is_a_miss(file_cache, tmp_path, content):
+    """Test valid JSON that is not a cache entry does not break the lookup."""
+    path = tmp_path / 'domain_overview' / 'key.json.gz'
+    path.parent.mkdir()
+    path.write_bytes(gzip.compress(content))
+    assert file_cache.get('domain_overview', 'key') is None
+
+def test_zero_ttl_disables_cache(tmp_path):
+    """Test a TTL of zero neither reads nor writes entries."""
+    file_cache = FileCache(str(tmp_path), ttl_seconds=0)
+    file_cache.set('domain_overview', 'key', {'result': 'success'})
+    assert file_cache.get('domain_overview', 'key') is None
+    assert not any(tmp_path.iterdir())
+
+@pytest.mark.respx(base_url="https://api.semrush.com/analytics/v3")
+def test_client_serves_repeat_requests_from_cache(api_key, test_domain, file_cache, respx_mock):
+    """Test a repeated request does not reach the API."""
+    semrush_client = SEMrushAPIV3Client(api_key=api_key, cache=file_cache)
+    route = respx_mock.get("/domain_overview").respond(json={'result': 'success'})
+    
+    first = semrush_client.get_domain_overview(test_domain)
+    second = semrush_client.get_domain_overview(test_domain)
+    
+    assert first == second == {'result': 'success'}
+    assert route.call_count == 1
+
+@pytest.mark.respx(base_url="https://api.semrush.com/analytics/v3")
+def test_client_without_cache_never_caches(api_key, test_domain, tmp_path, monkeypatch, respx_mock):
+    """Test a client only caches responses when given a cache."""
+    monkeypatch.chdir(tmp_path)
+    semrush_client = SEMrushAPIV3Client(api_key=api_key)
+    route = respx_mock.get("/domain_overview").respond(json={'result': 'success'})
+    
+    semrush_client.get_domain_overview(test_domain)
+    semrush_client.get_domain_overview(test_domain)
+    
+    assert semrush_client.cache is None
+    assert route.call_count == 2
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,113 @@
+"""Tests for the API rate limiter."""
+
+import asyncio
+import pytest
+from src.api import rate_limiter
+from src.api.rate_limiter import RateLimiter, AsyncRateLimiter, RateLimitManager
+
+class FakeClock:
+    """Stand-in for the time module that only advances when slept."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the rate limiter's clock with a controllable fake."""
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+def test_burst_within_capacity(fake_clock):
+    """Test requests up to the per-second capacity do not sleep."""
+    limiter = RateLimiter(calls_per_second=5, calls_per_minute=600)
+    for _ in range(5):
+        limiter.wait()
+    assert fake_clock.sleeps == []
+
+def test_waits_for_second_bucket(fake_clock):
+    """Test exhausting the per-second bucket sleeps until a token refills."""
+    limiter = RateLimiter(calls_per_second=2, calls_per_minute=600)
+    for _ in range(3):
+        limiter.wait()
+    assert sum(fake_clock.sleeps) == pytest.approx(0.5)
+
+def test_waits_for_minute_bucket(fake_clock):
+    """Test the per-minute budget is enforced independently."""
+    limiter = RateLimiter(calls_per_second=10, calls_per_minute=2)
+    for _ in range(3):
+        limiter.wait()
+    assert sum(fake_clock.sleeps) == pytest.approx(30.0)
+
+def test_tokens_refill_over_time(fake_clock):
+    """Test idle time refills the bucket up to its capacity."""
+    limiter = RateLimiter(calls_per_second=1, calls_per_minute=600)
+    limiter.wait()
+    fake_clock.now += 10
+    limiter.wait()
+    assert fake_clock.sleeps == []
+
+@pytest.mark.asyncio
+async def test_async_limiter_yields_while_waiting(fake_clock):
+    """Test the async limiter sleeps on the event loop instead of blocking."""
+    async_sleeps = []
+
+    async def fake_async_sleep(seconds):
+        async_sleeps.append(seconds)
+        fake_clock.now += seconds
+
+    limiter = AsyncRateLimiter(
+        RateLimiter(calls_per_second=2, calls_per_minute=600),
+        sleep=fake_async_sleep
+    )
+    await asyncio.gather(*(limiter.wait() for _ in range(3)))
+    assert fake_clock.sleeps == []
+    assert sum(async_sleeps) == pytest.approx(0.5)
+
+@pytest.mark.asyncio
+async def test_sync_and_async_callers_share_one_budget(fake_clock):
+    """Test mixing sync and async waits draws from the same token bucket."""
+    async_sleeps = []
+
+    async def fake_async_sleep(seconds):
+        async_sleeps.append(seconds)
+        fake_clock.now += seconds
+
+    sync_limiter = RateLimiter(calls_per_second=1, calls_per_minute=600)
+    async_limiter = AsyncRateLimiter(sync_limiter, sleep=fake_async_sleep)
+    sync_limiter.wait()
+    await async_limiter.wait()
+    sync_limiter.wait()
+    assert async_sleeps == [pytest.approx(1.0)]
+    assert fake_clock.sleeps == [pytest.approx(1.0)]
+
+def test_manager_async_limiter_shares_sync_buckets():
+    """Test the manager pairs an endpoint's async limiter with its sync limiter."""
+    manager = RateLimitManager()
+    async_limiter = manager.get_async_limiter('domain_overview', calls_per_second=1, calls_per_minute=45)
+    assert async_limiter.limiter is manager.get_limiter('domain_overview')
+    assert manager.get_async_limiter('domain_overview') is async_limiter
+
+def test_waiters_queue_behind_reservations(fake_clock):
+    """Test each waiter sleeps for its own slot instead of retrying."""
+    limiter = RateLimiter(calls_per_second=1, calls_per_minute=600)
+    for _ in range(3):
+        limiter.wait()
+    assert fake_clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+
+def test_try_acquire_does_not_wait(fake_clock):
+    """Test try_acquire fails fast once the bucket is empty."""
+    limiter = RateLimiter(calls_per_second=1, calls_per_minute=600)
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+    fake_clock.now += 1
+    assert limiter.try_acquire() is True
+    assert fake_clock.sleeps == []
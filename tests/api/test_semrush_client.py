@@ -1,11 +1,12 @@
 """Tests for SEMrush API V3 client - Domain Metrics specific."""
 
-import os
 import pytest
 import httpx
-from unittest.mock import patch, Mock
-from src.exceptions.errors import APIError
-from src.api.semrush_client import SEMrushAPIV3Client
+from src.exceptions.errors import APIError, ValidationError, DomainValidationError
+from src.api.semrush_client import SEMrushAPIV3Client, shutdown
+
+# Base URL the respx routes in this module are registered under
+API_BASE_URL = "https://api.semrush.com/analytics/v3"
 
 def test_client_initialization(api_key, mock_env_without_api_key):
     """Test client initialization with API key."""
@@ -33,8 +34,8 @@ def test_domain_overview(semrush_client, test_domain, mock_client):
         "organic_keywords",
         "paid_keywords"
     ]
-    for field in expected_fields:
-        assert field in response, f"Missing field: {field}"
+    missing = set(expected_fields) - response.keys()
+    assert not missing, f"Missing fields: {sorted(missing)}"
 
 def test_domain_metrics(semrush_client, test_domain, mock_client):
     """Test domain metrics endpoint."""
@@ -49,8 +50,8 @@ def test_domain_metrics(semrush_client, test_domain, mock_client):
         "backlink_count",
         "referring_domains"
     ]
-    for field in expected_fields:
-        assert field in response, f"Missing field: {field}"
+    missing = set(expected_fields) - response.keys()
+    assert not missing, f"Missing fields: {sorted(missing)}"
 
 def test_backlinks_overview(semrush_client, test_domain, mock_client):
     """Test backlinks overview endpoint."""
@@ -66,8 +67,8 @@ def test_backlinks_overview(semrush_client, test_domain, mock_client):
         "referring_ips",
         "referring_subnets"
     ]
-    for field in expected_fields:
-        assert field in response, f"Missing field: {field}"
+    missing = set(expected_fields) - response.keys()
+    assert not missing, f"Missing fields: {sorted(missing)}"
 
 def test_keywords_overview(semrush_client, test_domain, mock_client):
     """Test keywords overview endpoint."""
@@ -92,65 +93,142 @@ def test_related_phrases(semrush_client, mock_client):
     assert isinstance(response, dict)
     assert response.get("result") == "success"
 
-def test_error_handling(mock_client, monkeypatch):
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_error_handling(respx_mock):
     """Test error handling with invalid domain."""
-    def mock_error_request(*args, **kwargs):
-        mock_resp = Mock()
-        mock_resp.status_code = 401
-        mock_resp.text = "Unauthorized"
-        mock_resp.url = "https://api.semrush.com/analytics/v3/test"
-        mock_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "401 Unauthorized",
-            request=None,
-            response=mock_resp
-        )
-        return mock_resp
-
-    monkeypatch.setattr(httpx.Client, "request", mock_error_request)
+    respx_mock.get("/domain_overview").mock(
+        return_value=httpx.Response(401, text="Unauthorized")
+    )
     
     client = SEMrushAPIV3Client(api_key="invalid_key")
     with pytest.raises(APIError):
         client.get_domain_overview("example.com")
 
-def test_rate_limiting(semrush_client, test_domain, monkeypatch):
+@pytest.mark.parametrize("status_sequence", [
+    [200, 200, 429],
+    [200, 429],
+    [429],
+])
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_rate_limiting(semrush_client, test_domain, respx_mock, status_sequence):
     """Test rate limiting functionality."""
-    request_count = 0
-    
-    def mock_rate_limit_request(*args, **kwargs):
-        nonlocal request_count
-        request_count += 1
-        mock_resp = Mock()
-        mock_resp.url = "https://api.semrush.com/analytics/v3/test"
-        
-        if request_count > 2:  # Rate limit after 2 requests
-            mock_resp.status_code = 429
-            mock_resp.text = "Rate limit exceeded"
-            mock_resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-                "429 Too Many Requests",
-                request=None,
-                response=mock_resp
-            )
-        else:
-            mock_resp.status_code = 200
-            mock_resp.json.return_value = {"result": "success"}
-            mock_resp.raise_for_status.return_value = None
-        return mock_resp
-
-    monkeypatch.setattr(httpx.Client, "request", mock_rate_limit_request)
-    
-    # First two requests should succeed
-    for _ in range(2):
+    respx_mock.get("/domain_overview").mock(side_effect=[
+        httpx.Response(status, json={"result": "success"} if status == 200 else {"error": "Rate limit exceeded"})
+        for status in status_sequence
+    ])
+    
+    # Requests before the rate limit should succeed
+    for _ in status_sequence[:-1]:
         response = semrush_client.get_domain_overview(test_domain)
         assert response is not None
         assert response.get("result") == "success"
     
-    # Third request should hit rate limit
+    # Last request should hit rate limit
     with pytest.raises(APIError) as exc:
         semrush_client.get_domain_overview(test_domain)
     assert "429" in str(exc.value)
 
-def test_invalid_domain_format(semrush_client):
-    """Test with invalid domain format."""
-    with pytest.raises(APIError):
+@pytest.mark.respx(base_url=API_BASE_URL, assert_all_called=False)
+def test_invalid_domain_format(semrush_client, respx_mock):
+    """Test an invalid domain is rejected before any request is sent."""
+    route = respx_mock.get().respond(500)
+    
+    with pytest.raises(DomainValidationError) as exc:
         semrush_client.get_domain_overview("not-a-valid-domain")
+    # Callers catching either base class still see the error
+    assert isinstance(exc.value, APIError)
+    assert isinstance(exc.value, ValidationError)
+    assert not route.called
+
+@pytest.mark.parametrize("domain", [
+    "example.xn--p1ai",
+    "example.com.",
+    "пример.рф",
+])
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_domain_forms_reach_api(semrush_client, respx_mock, domain):
+    """Test punycode TLDs, FQDNs and raw IDNs are not rejected as invalid."""
+    route = respx_mock.get("/domain_overview").respond(json={"result": "success"})
+    
+    assert semrush_client.get_domain_overview(domain) == {"result": "success"}
+    assert route.calls.last.request.url.params["domain"] == domain
+
+@pytest.mark.asyncio
+@pytest.mark.respx(base_url=API_BASE_URL)
+async def test_async_domain_overview(async_semrush_client, test_domain, respx_mock):
+    """Test asynchronous domain overview endpoint."""
+    respx_mock.get("/domain_overview").respond(json={"result": "success"})
+    
+    response = await async_semrush_client.aget_domain_overview(test_domain)
+    assert response is not None
+    assert response.get("result") == "success"
+
+@pytest.mark.asyncio
+@pytest.mark.respx(base_url=API_BASE_URL)
+async def test_async_get_all(async_semrush_client, test_domain, respx_mock):
+    """Test concurrent retrieval of all domain endpoints."""
+    route = respx_mock.get().respond(json={"result": "success"})
+    
+    response = await async_semrush_client.aget_all(test_domain)
+    assert set(response) == {"overview", "metrics", "backlinks"}
+    assert all(data.get("result") == "success" for data in response.values())
+    assert route.call_count == 3
+
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_request_query_string(semrush_client, test_domain, respx_mock):
+    """Test request parameters are encoded into the request URL."""
+    route = respx_mock.get("/backlinks_overview").respond(json={"result": "success"})
+    
+    semrush_client.get_backlinks_overview(test_domain)
+    url = route.calls.last.request.url
+    assert url.path == "/analytics/v3/backlinks_overview"
+    assert url.params["domain"] == test_domain
+    assert url.params["key"] == semrush_client.api_key
+    assert url.params["export_columns"] == semrush_client.ENDPOINT_COLUMNS["backlinks_overview"]
+
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_timeout_handling(semrush_client, test_domain, respx_mock):
+    """Test request timeouts are raised as APIError."""
+    respx_mock.get("/domain_metrics").mock(side_effect=httpx.ReadTimeout("timed out"))
+    
+    with pytest.raises(APIError) as exc:
+        semrush_client.get_domain_metrics(test_domain)
+    assert "timed out" in str(exc.value)
+
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_batch(semrush_client, test_domain, respx_mock):
+    """Test synchronous batch retrieval runs the async requests to completion."""
+    respx_mock.get().respond(json={"result": "success"})
+    
+    results = semrush_client.batch([test_domain])
+    assert len(results) == 1
+    assert results[0]["overview"].get("result") == "success"
+    assert semrush_client._async_client is None
+
+def test_clients_share_connection_pool(api_key):
+    """Test client instances reuse the process-wide connection pool."""
+    first = SEMrushAPIV3Client(api_key=api_key)
+    second = SEMrushAPIV3Client(api_key=api_key)
+    assert first.client is second.client
 
+@pytest.mark.respx(base_url=API_BASE_URL)
+def test_requests_after_close_and_shutdown(api_key, test_domain, respx_mock):
+    """Test a closed client and a shut-down pool are reopened on the next request."""
+    route = respx_mock.get("/domain_overview").respond(json={"result": "success"})
+    
+    client = SEMrushAPIV3Client(api_key=api_key)
+    client.close()
+    assert client.get_domain_overview(test_domain) == {"result": "success"}
+    
+    shutdown()
+    assert client.get_domain_overview(test_domain) == {"result": "success"}
+    assert route.call_count == 2
+
+def test_close_closes_async_session(api_key):
+    """Test close() also closes an open asynchronous session."""
+    client = SEMrushAPIV3Client(api_key=api_key)
+    async_client = client.async_client
+    
+    client.close()
+    assert async_client.is_closed
+    assert client._async_client is None
@@ -0,0 +1,112 @@
+"""Tests for the data transformer."""
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from src.utils.data_transformer import data_transformer
+
+@pytest.mark.parametrize("raw, expected", [
+    ("https://example.com/", "example.com"),
+    ("http://www.Example.com/path/page", "example.com"),
+    ("  WWW.example.com  ", "example.com"),
+    ("example.com /path", "example.com"),
+    ("example.com", "example.com"),
+])
+def test_clean_domain(raw, expected):
+    """Test protocol, www prefix, case and path are stripped."""
+    assert data_transformer.clean_domain(raw) == expected
+
+def test_clean_domain_passes_non_strings_through():
+    """Test unhashable values are returned unchanged rather than raising."""
+    value = ["example.com"]
+    assert data_transformer.clean_domain(value) is value
+
+@pytest.mark.parametrize("raw, expected", [
+    ("1.5K", 1500),
+    ("2m", 2000000),
+    ("1,234", 1234),
+    ("n/a", None),
+    ("", None),
+])
+def test_parse_traffic_value(raw, expected):
+    """Test unit suffixes and separators are handled."""
+    assert data_transformer.parse_traffic_value(raw) == expected
+
+@pytest.mark.parametrize("raw, expected", [
+    ("$1,234.56", Decimal("1234.56")),
+    ("€12", Decimal("12.00")),
+    ("0.5", Decimal("0.50")),
+    (".75", Decimal("0.75")),
+    ("1.239", Decimal("1.24")),
+    ("1.999", Decimal("2.00")),
+    ("0.005", Decimal("0.01")),
+    ("-3.10", Decimal("-3.10")),
+    ("$ 12.50", Decimal("12.50")),
+    ("  12.50  ", Decimal("12.50")),
+    ("1e3", Decimal("1000.00")),
+    ("1.5E-1", Decimal("0.15")),
+    ("N/A", None),
+    ("abc", None),
+])
+def test_parse_currency_amount(raw, expected):
+    """Test currency amounts are parsed into Decimals rounded to the cent."""
+    assert data_transformer.parse_currency_amount(raw) == expected
+
+def test_normalized_costs_are_decimal_dollars():
+    """Test normalized cost fields keep the dollar unit of the NUMERIC(10,2) columns."""
+    metrics = data_transformer.normalize_metrics_data({'organic_traffic_cost': '$1,234.56', 'paid_traffic_cost': 'n/a'})
+    assert metrics['organic_traffic_cost'] == Decimal('1234.56')
+    assert metrics['paid_traffic_cost'] is None
+    keyword = data_transformer.normalize_keyword_data({'keyword': 'seo', 'cpc': '$1.50'})
+    assert keyword['cpc'] == Decimal('1.50')
+    # Sub-cent amounts round like the NUMERIC(10,2) columns instead of truncating
+    assert data_transformer.normalize_metrics_data({'traffic_cost': '1.999'})['traffic_cost'] == Decimal('2.00')
+
+def test_format_api_parameters():
+    """Test parameter values are converted to API strings."""
+    params = {
+        'columns': ['Ph', 'Po'],
+        'date': datetime(2024, 1, 31, 12, 30),
+        'export': True,
+        'limit': 100,
+        'database': 'us',
+    }
+    assert data_transformer.format_api_parameters(params) == {
+        'columns': 'Ph,Po',
+        'date': '2024-01-31',
+        'export': '1',
+        'limit': '100',
+        'database': 'us',
+    }
+
+def test_normalize_metrics_batch_matches_row_normalization():
+    """Test the vectorized batch agrees with normalize_metrics_data per row."""
+    pd = pytest.importorskip("pandas")
+    rows = [
+        {'organic_traffic': '1.5K', 'market_share': '15.5%', 'traffic_cost': '$1,234.56'},
+        {'organic_traffic': '1,234', 'market_share': '3', 'traffic_cost': '12'},
+        {'organic_traffic': 'n/a', 'market_share': 'n/a', 'traffic_cost': 'n/a'},
+    ]
+    batch = data_transformer.normalize_metrics_batch(pd.DataFrame(rows))
+    for row, normalized in zip(rows, batch.to_dict('records')):
+        expected = data_transformer.normalize_metrics_data(row)
+        for field, value in expected.items():
+            if value is None:
+                assert pd.isna(normalized[field])
+            else:
+                assert normalized[field] == value
+
+@pytest.mark.parametrize("rows", [
+    [
+        {'keyword': 'SEO Tools', 'search_volume': '1.2K', 'position': '3', 'cpc': '$1.50', 'competition': '45%', 'url': 'https://a.com'},
+        {'keyword': 'Backlinks', 'search_volume': 'n/a', 'position': '', 'cpc': 'N/A', 'competition': '0.3'},
+    ],
+    [
+        {'keyword': 'SEO Tools', 'search_volume': '1.2K'},
+        {'keyword': 'Backlinks', 'position': 'first'},
+    ],
+])
+def test_normalize_keyword_batch_matches_row_normalization(rows):
+    """Test the batch agrees with normalize_keyword_data per row."""
+    expected = [data_transformer.normalize_keyword_data(row) for row in rows]
+    assert data_transformer.normalize_keyword_batch(rows) == expected
@@ -0,0 +1,137 @@
+"""Tests for the validation helper."""
+
+import pytest
+from src.utils.validation import validation_helper
+
+BATCH_ITEMS = [
+    "example.com",
+    "EXAMPLE.co.uk",
+    "https://example.com/path?q=1",
+    "http://192.168.0.1:8080",
+    "http://localhost",
+    "ftp://example.com",
+    "bad_domain",
+    "",
+]
+
+def test_validate_batch_matches_single_item_checks():
+    """Test batch validation agrees with validate_domain/validate_url."""
+    expected = [
+        (validation_helper.validate_domain(item), validation_helper.validate_url(item))
+        for item in BATCH_ITEMS
+    ]
+    assert validation_helper.validate_batch(BATCH_ITEMS) == expected
+
+def test_validate_domains():
+    """Test batch domain validation keeps input order."""
+    assert validation_helper.validate_domains(["example.com", "not a domain", "a.example.org", "example.xn--p1ai"]) == [
+        True, False, True, True
+    ]
+
+def test_validate_domain_rejects_non_strings():
+    """Test unhashable and other non-string values are invalid rather than raising."""
+    assert validation_helper.validate_domain(["example.com"]) is False
+    assert validation_helper.validate_domain({"domain": "example.com"}) is False
+    assert validation_helper.validate_domain(None) is False
+
+def test_validate_ranges_batch_matches_single_value_checks():
+    """Test the batch range check agrees with validate_numeric_range."""
+    np = pytest.importorskip("numpy")
+    range_keys = ['position', 'search_volume', 'percentage']
+    rows = [
+        [1, 0, 0],
+        [100, 1000000000, 100],
+        [0, -1, 100.5],
+        [101, 500, 50],
+    ]
+    expected = [
+        [validation_helper.validate_numeric_range(value, key) for value, key in zip(row, range_keys)]
+        for row in rows
+    ]
+    assert validation_helper.validate_ranges_batch(rows, range_keys).tolist() == expected
+
+def test_validate_ranges_batch_skips_missing_values():
+    """Test NaN cells are treated as missing rather than out of range."""
+    np = pytest.importorskip("numpy")
+    result = validation_helper.validate_ranges_batch([[np.nan, 5]], ['position', 'unknown'])
+    assert result.tolist() == [[True, True]]
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://example.com/path", True),
+    ("HTTP://EXAMPLE.COM/Path", True),
+    ("http://10.0.0.1:8080/", True),
+    ("example.com", False),
+    ("ftp://example.com", False),
+    ("", False),
+])
+def test_validate_url(url, expected):
+    """Test URLs need an http(s) scheme and match regardless of case."""
+    assert validation_helper.validate_url(url) is expected
+
+def test_keyword_error_mask():
+    """Test the mask flags missing and invalid fields and formats back to messages."""
+    data = {'Keyword': 'seo', 'Position': 150, 'SearchVolume': 10}
+    required = ['Keyword', 'Position', 'CPC']
+    mask = validation_helper.keyword_error_mask(data, required)
+    assert mask == (
+        validation_helper.keyword_field_bit('Position') | validation_helper.keyword_field_bit('CPC')
+    )
+    assert validation_helper.format_keyword_errors(data, mask, required) == [
+        "Missing required field: CPC",
+        "Invalid position value: 150",
+    ]
+    assert validation_helper.keyword_error_mask(data, ['Keyword']) == validation_helper.keyword_field_bit('Position')
+
+def test_validate_metrics_data():
+    """Test the generated metrics validator reports each problem once."""
+    errors = validation_helper.validate_metrics_data(
+        {'Date': '2024-01-31', 'OrganicTraffic': -5, 'Visibility': 50}
+    )
+    assert errors == [
+        "Invalid date format: 2024-01-31",
+        "Invalid OrganicTraffic value: -5",
+    ]
+    assert validation_helper.validate_metrics_data({'Date': '20240131'}) == []
+    assert validation_helper.validate_metrics_data({}, ['Date', 'Visibility']) == [
+        "Missing required field: Date",
+        "Missing required field: Visibility",
+    ]
+
+@pytest.mark.parametrize("date_str, expected", [
+    ("20240131", True),
+    ("20240229", True),
+    ("20230229", False),
+    ("20241301", False),
+    ("2024013a", False),
+    ("2024-01-31", False),
+])
+def test_validate_date_format_yyyymmdd(date_str, expected):
+    """Test SEMrush YYYYMMDD dates are checked like strptime would."""
+    assert validation_helper.validate_date_format(date_str, '%Y%m%d') is expected
+
+@pytest.mark.parametrize("value, expected", [
+    (50, True),
+    (0.5, True),
+    (101, False),
+    ("50", False),
+    (None, False),
+])
+def test_validate_numeric_range(value, expected):
+    """Test non-numeric values are rejected rather than compared."""
+    assert validation_helper.validate_numeric_range(value, 'percentage') is expected
+
+def test_numeric_range_paths_agree():
+    """Test the scalar, generated and batch range checks accept the same values."""
+    np = pytest.importorskip("numpy")
+    from decimal import Decimal
+    values = [np.int64(50), np.float32(0.5), Decimal("12.5"), np.int64(101), "50"]
+    expected = [True, True, True, False, False]
+    assert [validation_helper.validate_numeric_range(v, 'percentage') for v in values] == expected
+    batch = validation_helper.validate_ranges_batch([values], ['percentage'] * len(values))
+    assert batch.tolist() == [expected]
+    assert validation_helper.validate_ranges_batch([[50, "50"]], ['percentage'] * 2).tolist() == [[True, False]]
+    errors = [
+        validation_helper.validate_metrics_data({'Date': '20240101', 'Visibility': v})
+        for v in values
+    ]
+    assert [not e for e in errors] == expected